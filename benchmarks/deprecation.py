@@ -0,0 +1,39 @@
+"""Measure the per-call overhead of the :func:`deprecated` decorator, once
+its warning has been emitted, compared with an undecorated function.
+
+Usage: python benchmarks/deprecation.py [calls]
+"""
+
+import sys
+import time
+import warnings
+
+from pywisetransfer.deprecation import deprecated
+
+
+def undecorated(n):
+    return n
+
+
+@deprecated(message="benchmark")
+def decorated(n):
+    return n
+
+
+def measure(label, f, calls):
+    start = time.perf_counter()
+    for n in range(calls):
+        f(n)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed * 1e9 / calls:>8.1f} ns/call")
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    warnings.simplefilter("default")
+    measure("undecorated", undecorated, calls)
+    measure("deprecated", decorated, calls)
+
+
+if __name__ == "__main__":
+    main()
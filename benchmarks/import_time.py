@@ -0,0 +1,70 @@
+"""Measure cold-start import time for common entry points, using
+``python -X importtime`` in a fresh interpreter for each run.
+
+For each scenario this reports the median total import time, and which of
+the heavier dependencies were imported along the way.
+
+Usage: python benchmarks/import_time.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+SCENARIOS = {
+    "import pywisetransfer": "import pywisetransfer",
+    "construct Client": "import pywisetransfer; pywisetransfer.Client(api_key='key')",
+    "first resource": "import pywisetransfer; pywisetransfer.Client(api_key='key').profiles",
+    "import webhooks": "import pywisetransfer.webhooks",
+    "webhook verifier": "import pywisetransfer.webhooks as w; w.get_default_verifier()",
+}
+
+HEAVY_MODULES = ("apiron", "cryptography", "munch", "requests", "sqlite3")
+
+
+def import_times(code):
+    """Return the cumulative import time, in microseconds, of each module
+    imported directly by ``code``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.rstrip()] = int(cumulative)
+    return times
+
+
+def measure(label, code, runs, startup):
+    totals = []
+    for _ in range(runs):
+        times = import_times(code)
+        # Top-level imports are not indented beneath another module; those
+        # made during interpreter startup are excluded
+        totals.append(
+            sum(
+                t
+                for name, t in times.items()
+                if not name.startswith("  ") and name.strip() not in startup
+            )
+        )
+    modules = {name.strip() for name in times}
+    heavy = ", ".join(m for m in HEAVY_MODULES if m in modules) or "-"
+    print(f"{label:<22} {statistics.median(totals) / 1000:>8.1f} ms   {heavy}")
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    startup = {name.strip() for name in import_times("pass")}
+    print(f"{'scenario':<22} {'median':>11}   heavy imports")
+    for label, code in SCENARIOS.items():
+        measure(label, code, runs, startup)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Load-test the client against the local mock Wise server, using a single
+thread, a thread pool and the async client.
+
+For each mode this reports requests per second, p50 and p99 latency, and
+the peak memory allocated during a second, traced run of the same load.
+A final run streams a large balance statement.
+
+pytest-benchmark and asv are not dependencies of this project, so this is
+a standalone script like the other benchmarks.
+
+Usage: python benchmarks/load.py [requests] [concurrency] [latency]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from pywisetransfer.testing import MockWiseServer
+
+START, END = "2024-01-01T00:00:00Z", "2024-12-31T23:59:59.999Z"
+PRIVATE_KEY_FILE = os.path.join(os.path.dirname(__file__), "..", "test", "test-sca.pem")
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_sync(server, requests, concurrency):
+    client = server.client()
+    return [timed(lambda: client.profiles.get(profile_id=1)) for _ in range(requests)]
+
+
+def run_threaded(server, requests, concurrency):
+    client = server.client(pool_maxsize=concurrency)
+    with ThreadPoolExecutor(concurrency) as executor:
+        return list(
+            executor.map(
+                lambda _: timed(lambda: client.profiles.get(profile_id=1)), range(requests)
+            )
+        )
+
+
+def run_async(server, requests, concurrency):
+    from pywisetransfer.async_client import AsyncClient
+
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        async with AsyncClient(api_key="mock-api-key", base_url=server.url) as client:
+
+            async def call():
+                async with semaphore:
+                    start = time.perf_counter()
+                    await client.profiles.get(profile_id=1)
+                    return time.perf_counter() - start
+
+            return await asyncio.gather(*(call() for _ in range(requests)))
+
+    return asyncio.run(main())
+
+
+def measure(label, run, server, requests, concurrency):
+    start = time.perf_counter()
+    latencies = run(server, requests, concurrency)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    run(server, requests, concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    if len(latencies) > 1:
+        percentiles = statistics.quantiles(latencies, n=100)
+        p50, p99 = percentiles[49], percentiles[98]
+    else:
+        p50 = p99 = latencies[0]
+    print(
+        f"{label:<10} {len(latencies) / elapsed:>9.1f} req/s"
+        f"   p50 {p50 * 1000:>7.2f} ms   p99 {p99 * 1000:>7.2f} ms"
+        f"   peak {peak / 1024:>9.1f} KiB"
+    )
+
+
+def measure_statement(server, transactions):
+    client = server.client(private_key_file=PRIVATE_KEY_FILE)
+
+    def run():
+        return sum(1 for _ in client.balance_statements.iter_transactions(1, 2, "EUR", START, END))
+
+    run()  # the server generates the statement once, then reuses it
+    elapsed = timed(run)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{'statement':<10} {transactions / elapsed:>9.1f} transactions/s"
+        f"   {elapsed * 1000:>9.2f} ms   peak {peak / 1024:>9.1f} KiB"
+    )
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.0
+
+    transactions = 50000
+    with MockWiseServer(latency=latency, statement_transactions=transactions) as server:
+        measure("sync", run_sync, server, requests, concurrency)
+        measure("threaded", run_threaded, server, requests, concurrency)
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            print("async      skipped; install pywisetransfer[async]")
+        else:
+            measure("async", run_async, server, requests, concurrency)
+        measure_statement(server, transactions)
+
+
+if __name__ == "__main__":
+    main()
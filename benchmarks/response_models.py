@@ -0,0 +1,91 @@
+"""Compare munchify with the compact struct and lazy response modes on a
+large balance statement response.
+
+For each conversion this reports the time taken to convert the decoded
+JSON, the number of memory blocks retained by the result, and the peak
+memory allocated during conversion.
+
+Usage: python benchmarks/response_models.py [transactions]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from munch import munchify
+
+from pywisetransfer.models import lazify, structify
+
+
+def transaction(n):
+    return {
+        "type": "DEBIT",
+        "date": f"2018-04-30T08:47:{n % 60:02d}.832Z",
+        "amount": {"value": -7.76, "currency": "EUR"},
+        "totalFees": {"value": 0.04, "currency": "EUR"},
+        "details": {
+            "type": "CARD",
+            "description": "Card transaction of 6.80 GBP issued by Tfl.gov.uk/cp TFL TRAVEL CH",
+            "amount": {"value": 6.8, "currency": "GBP"},
+            "category": "Transportation Suburban and Loca",
+            "merchant": {
+                "name": "Tfl.gov.uk/cp",
+                "firstLine": None,
+                "postCode": "SW1H 0TL  ",
+                "city": "TFL TRAVEL CH",
+                "state": "   ",
+                "country": "GB",
+                "category": "Transportation Suburban and Loca",
+            },
+        },
+        "exchangeDetails": {"forAmount": {"value": 6.8, "currency": "GBP"}, "rate": None},
+        "runningBalance": {"value": 16.01, "currency": "EUR"},
+        "referenceNumber": f"CARD-{n}",
+    }
+
+
+def statement(transactions):
+    return json.dumps(
+        {
+            "accountHolder": {"type": "PERSONAL", "firstName": "Oliver", "lastName": "Wilson"},
+            "transactions": [transaction(n) for n in range(transactions)],
+            "endOfStatementBalance": {"value": 9.94, "currency": "EUR"},
+        }
+    ).encode()
+
+
+def measure(name, convert, body):
+    data = json.loads(body)
+
+    start = time.perf_counter()
+    convert(data)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    result = convert(data)
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    print(
+        f"{name:<10} {elapsed * 1000:>9.1f} ms {blocks:>12,} blocks {peak / 2**20:>9.1f} MiB peak"
+    )
+
+
+def main():
+    transactions = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    body = statement(transactions)
+
+    start = time.perf_counter()
+    json.loads(body)
+    print(f"json.loads {(time.perf_counter() - start) * 1000:>9.1f} ms ({len(body):,} bytes)")
+
+    measure("munchify", munchify, body)
+    measure("structify", structify, body)
+    measure("lazify", lazify, body)
+
+
+if __name__ == "__main__":
+    main()
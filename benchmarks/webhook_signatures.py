@@ -0,0 +1,63 @@
+"""Compare webhook signature verification throughput when the public key
+is parsed for every payload against a reusable :class:`WebhookVerifier`.
+
+Usage: python benchmarks/webhook_signatures.py [iterations]
+"""
+
+import sys
+import time
+from base64 import b64decode
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+from pywisetransfer.keys import get_webhook_public_key
+from pywisetransfer.webhooks import WebhookVerifier, verify_signatures
+
+PAYLOAD = b'{"data":{"resource":{"id":0,"profile_id":0,"account_id":0,"type":"transfer"},"current_state":"processing","previous_state":"incoming_payment_waiting","occurred_at":"2022-02-23T19:22:53Z"},"subscription_id":"00000000-0000-0000-0000-000000000000","event_type":"transfers#state-change","schema_version":"2.0.0","sent_at":"2022-02-23T19:22:53Z"}'
+SIGNATURE = b64decode(
+    "EMRety5CM0VqStb6bIeB2DeQwdAO5Nm06ZSSGT0/8qW4+cbYDaPwFa5bL1Ylkn/E/JqKhZNtydeT0x+z+nkKCqlFx3Mt/K/WCSD9t+stoZa/Viv8GY8gVzt20A//2+mg0lqCdob5KFCBGHa7GRAwpO4WR5i5reBo17xubq6uVCB8/4hEUVDEstX1m32TU1OES1pFwWECCE/uFPoVJ+5h9BFqnVLSh2XnJde+9aHZ1N+nPBljZWCi9Z+iPpr1MFtHJdjGMPol8+i0VGzi02nhiHUNghmK4uIajB3rledPDZ0MgkQ3wfzJuzHcKGrb0iUMwAsOUNyEJT3b0/g4J7Ka+Q=="
+)
+
+
+def verify_with_key_parsing(payload, signature, environment="sandbox"):
+    # The approach used before WebhookVerifier: parse the PEM for every payload
+    key_data = get_webhook_public_key(environment)
+    public_key = load_pem_public_key(key_data, backend=default_backend())
+    try:
+        public_key.verify(signature, payload, padding.PKCS1v15(), hashes.SHA256())
+        return True
+    except InvalidSignature:
+        return False
+
+
+def measure(name, verify, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        assert verify(PAYLOAD, SIGNATURE)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {iterations / elapsed:>12,.0f} verifications/s")
+
+
+def measure_batch(name, iterations, **kwargs):
+    items = [(PAYLOAD, SIGNATURE)] * iterations
+    start = time.perf_counter()
+    results = verify_signatures(items, **kwargs)
+    elapsed = time.perf_counter() - start
+    assert all(result.valid for result in results)
+    print(f"{name:<24} {iterations / elapsed:>12,.0f} verifications/s")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    measure("parse key per call", verify_with_key_parsing, iterations)
+    measure("WebhookVerifier", WebhookVerifier().verify, iterations)
+    measure_batch("batch (threads)", iterations)
+    measure_batch("batch (processes)", iterations, use_processes=True)
+
+
+if __name__ == "__main__":
+    main()
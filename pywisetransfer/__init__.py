@@ -1,27 +1,56 @@
 from __future__ import annotations
 
+import hashlib
+from abc import ABC, abstractmethod
+import threading
+from collections.abc import Iterable
+from functools import cached_property
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from pywisetransfer.deprecation import deprecated
 from pywisetransfer.exceptions import WiseClientConfigurationException
 
+if TYPE_CHECKING:
+    from urllib3.util import Retry
+    from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 
-class Client:
-    def add_resources(self) -> None:
-        from pywisetransfer.account_details import AccountDetails
-        from pywisetransfer.balance_statements import BalanceStatements
-        from pywisetransfer.balances import Balances
-        from pywisetransfer.borderless_account import BorderlessAccount
-        from pywisetransfer.multi_currency_account import MultiCurrencyAccount
-        from pywisetransfer.profile import Profile
-        from pywisetransfer.subscription import Subscription
-        from pywisetransfer.user import User
-
-        self.account_details = AccountDetails(client=self)
-        self.balance_statements = BalanceStatements(client=self)
-        self.balances = Balances(client=self)
-        self.borderless_accounts = BorderlessAccount(client=self)
-        self.multi_currency_account = MultiCurrencyAccount(client=self)
-        self.profiles = Profile(client=self)
-        self.subscriptions = Subscription(client=self)
-        self.users = User(client=self)
+    from pywisetransfer.bulk import ProfileResult
+    from pywisetransfer.cache import ResponseCache
+    from pywisetransfer.cassette import Cassette
+    from pywisetransfer.instrumentation import Listener
+    from pywisetransfer.ratelimit import RateLimit
+    from pywisetransfer.retry import RetryPolicy
+    from pywisetransfer.session import ConnectionStats, WiseSession
+    from pywisetransfer.singleflight import SingleFlight
+
+
+class LazyResource:
+    """A resource wrapper that is built, and its module imported, the first
+    time it is accessed on a client."""
+
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+
+    def __set_name__(self, owner: type, attr: str) -> None:
+        self.attr = attr
+
+    def build(self, client: BaseClient) -> Any:
+        return getattr(import_module(self.module), self.name)(client=client)
+
+    def __get__(self, instance: BaseClient | None, owner: type) -> Any:
+        if instance is None:
+            return self
+        resource = instance.__dict__[self.attr] = self.build(instance)
+        return resource
+
+
+class BaseClient(ABC):
+    """Configuration and behaviour shared by :class:`Client` and
+    :class:`~pywisetransfer.async_client.AsyncClient`: credentials, SCA
+    approvals, response conversion, caching, rate limits, retries and
+    instrumentation."""
 
     def __init__(
         self,
@@ -29,6 +58,15 @@ class Client:
         environment: str = "sandbox",
         private_key_file: str | None = None,
         private_key_data: bytes | None = None,
+        sca_approval_ttl: float = 300.0,
+        response_mode: str = "munch",
+        json_backend: str = "json",
+        cache: ResponseCache | None = None,
+        max_validators: int = 256,
+        coalesce_requests: bool = False,
+        rate_limits: dict[str, RateLimit] | None = None,
+        retry: RetryPolicy | None = None,
+        base_url: str | None = None,
     ):
         if api_key is None:
             raise WiseClientConfigurationException(
@@ -48,8 +86,218 @@ class Client:
             with open(private_key_file, "rb") as f:
                 private_key_data = f.read()
 
+        from pywisetransfer.json_backends import get_json_loads
+        from pywisetransfer.models import RESPONSE_MODES
+
+        if response_mode not in RESPONSE_MODES:
+            raise WiseClientConfigurationException(
+                f"pywisetransfer.response_mode must be one of {sorted(RESPONSE_MODES)}"
+            )
+
         self.api_key = api_key
         self.environment = environment
+        # Overrides the environment's API domain, e.g. for a local test server
+        self.base_url = base_url
         self.private_key_file = private_key_file
         self.private_key_data = private_key_data
-        self.add_resources()
+        self.response_mode = response_mode
+        self._convert = RESPONSE_MODES[response_mode]
+        self.json_loads = get_json_loads(json_backend)
+        self.cache = cache
+
+        from pywisetransfer.cache import MemoryCache
+        from pywisetransfer.sca import ScaApproval
+
+        self.sca = ScaApproval(ttl=sca_approval_ttl)
+        # ETag and Last-Modified validators, with the responses they describe
+        self.validators = MemoryCache(maxsize=max_validators)
+        # Identical GET requests made concurrently share a single response
+        self.single_flight = self._create_single_flight() if coalesce_requests else None
+        self.rate_limiter = None
+        if rate_limits:
+            from pywisetransfer.ratelimit import RateLimiter
+
+            self.rate_limiter = RateLimiter(rate_limits)
+        self.retry_policy = retry
+        # Instrumentation callbacks; calls are only timed when there are any
+        self.listeners: list[Listener] = []
+
+    @abstractmethod
+    def _create_single_flight(self) -> Any:
+        """Return the object that coalesces this client's concurrent
+        requests, when ``coalesce_requests`` is enabled."""
+
+    @cached_property
+    def private_key(self) -> PrivateKeyTypes | None:
+        if self.private_key_data is None:
+            return None
+
+        from pywisetransfer.signing import load_private_key
+
+        return load_private_key(self.private_key_data)
+
+    @cached_property
+    def identity(self) -> str:
+        # Distinguishes cached responses between clients, without storing
+        # the API key itself in cache keys
+        key = f"{self.environment}:{self.api_key}"
+        if self.base_url:
+            key = f"{key}:{self.base_url}"
+        digest = hashlib.sha256(key.encode())
+        return digest.hexdigest()[:32]
+
+    def invalidate_cache(self, path: str = "") -> None:
+        if self.cache is not None:
+            self.cache.invalidate(f"{self.identity}:{path}")
+
+    def add_listener(self, listener: Listener) -> None:
+        """Register a callback that receives a
+        :class:`~pywisetransfer.instrumentation.Timing` for each timed phase
+        of every endpoint call made by this client."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        self.listeners.remove(listener)
+
+    def convert(self, data: Any, endpoint: str = "", method: str = "") -> Any:
+        """Wrap decoded JSON data in this client's response type.  The
+        conversion is timed for listeners, labelled with the path template
+        and method of the ``endpoint`` that returned the data."""
+        if not self.listeners:
+            return self._convert(data)
+
+        from pywisetransfer.instrumentation import Timer
+
+        with Timer(self.listeners, endpoint, method, "convert"):
+            return self._convert(data)
+
+
+class Client(BaseClient):
+    account_details = LazyResource("pywisetransfer.account_details", "AccountDetails")
+    balance_statements = LazyResource("pywisetransfer.balance_statements", "BalanceStatements")
+    balances = LazyResource("pywisetransfer.balances", "Balances")
+    borderless_accounts = LazyResource("pywisetransfer.borderless_account", "BorderlessAccount")
+    multi_currency_account = LazyResource(
+        "pywisetransfer.multi_currency_account", "MultiCurrencyAccount"
+    )
+    profiles = LazyResource("pywisetransfer.profile", "Profile")
+    subscriptions = LazyResource("pywisetransfer.subscription", "Subscription")
+    users = LazyResource("pywisetransfer.user", "User")
+
+    def __init__(
+        self,
+        api_key: str,
+        environment: str = "sandbox",
+        private_key_file: str | None = None,
+        private_key_data: bytes | None = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        timeout: tuple[float, float] | None = None,
+        sca_approval_ttl: float = 300.0,
+        response_mode: str = "munch",
+        json_backend: str = "json",
+        cache: ResponseCache | None = None,
+        max_validators: int = 256,
+        coalesce_requests: bool = False,
+        rate_limits: dict[str, RateLimit] | None = None,
+        retry: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ):
+        super().__init__(
+            api_key=api_key,
+            environment=environment,
+            private_key_file=private_key_file,
+            private_key_data=private_key_data,
+            sca_approval_ttl=sca_approval_ttl,
+            response_mode=response_mode,
+            json_backend=json_backend,
+            cache=cache,
+            max_validators=max_validators,
+            coalesce_requests=coalesce_requests,
+            rate_limits=rate_limits,
+            retry=retry,
+            base_url=base_url,
+        )
+        self.timeout = timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._session: WiseSession | None = None
+        self._session_lock = threading.Lock()
+
+    @deprecated(message="Client.add_resources is deprecated; resources are built on first access")
+    def add_resources(self) -> None:
+        # Builds every resource immediately, as clients used to on creation
+        for name, value in vars(Client).items():
+            if isinstance(value, LazyResource):
+                getattr(self, name)
+
+    def _create_single_flight(self) -> SingleFlight:
+        from pywisetransfer.singleflight import SingleFlight
+
+        return SingleFlight()
+
+    @property
+    def session(self) -> WiseSession:
+        # Created on first use, so that constructing a client does not
+        # import requests and apiron
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> WiseSession:
+        from apiron.client import DEFAULT_RETRY
+
+        from pywisetransfer.session import WiseSession
+
+        # apiron's default adapter retries server errors, and waits out
+        # Retry-After itself; leave those to the retry policy and rate limiter
+        max_retries: Retry | int = DEFAULT_RETRY
+        if self.retry_policy is not None:
+            max_retries = 0
+        elif self.rate_limiter is not None:
+            max_retries = DEFAULT_RETRY.new(respect_retry_after_header=False)
+        return WiseSession(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=max_retries,
+        )
+
+    def bulk_balances(
+        self, profile_ids: Iterable[Any], types: str | list[str] = "STANDARD", max_workers: int = 8
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import fan_out
+
+        return fan_out(lambda p: self.balances.list(p, types=types), profile_ids, max_workers)
+
+    def bulk_account_details(
+        self, profile_ids: Iterable[Any], max_workers: int = 8
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import fan_out
+
+        return fan_out(self.account_details.list, profile_ids, max_workers)
+
+    def bulk_subscriptions(
+        self, profile_ids: Iterable[Any], max_workers: int = 8
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import fan_out
+
+        return fan_out(self.subscriptions.list, profile_ids, max_workers)
+
+    def record(self, path: str) -> Cassette:
+        """Record this client's HTTP requests and responses to a cassette
+        file, which is written when the returned cassette is closed."""
+        from pywisetransfer.cassette import Cassette
+
+        return Cassette(self.session, path, mode="record")
+
+    def replay(self, path: str) -> Cassette:
+        """Answer this client's HTTP requests from a recorded cassette file,
+        until the returned cassette is closed."""
+        from pywisetransfer.cassette import Cassette
+
+        return Cassette(self.session, path, mode="replay")
+
+    def connection_stats(self) -> ConnectionStats:
+        return self.session.connection_stats()
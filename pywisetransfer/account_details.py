@@ -1,14 +1,15 @@
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
+from pywisetransfer.pagination import OffsetPaging, iter_items
 
 
 class AccountDetailsService(Base):
-    list = WiseEndpoint(path="/v1/profiles/{profile_id}/account-details")
+    list = WiseEndpoint(path="/v1/profiles/{profile_id}/account-details", cache_ttl=300)
 
 
 class AccountDetails:
@@ -16,4 +17,14 @@ class AccountDetails:
         self.service = AccountDetailsService(client=client)
 
     def list(self, profile_id: str) -> list[Any]:
-        return munchify(self.service.list(profile_id=profile_id))
+        return self.service.convert(self.service.list(profile_id=profile_id), "list")
+
+    def iter_account_details(
+        self, profile_id: str, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[Any]:
+        return iter_items(
+            lambda params: self.service.list(profile_id=profile_id, params=params),
+            OffsetPaging(limit=page_size),
+            partial(self.service.convert, endpoint="list"),
+            prefetch=prefetch,
+        )
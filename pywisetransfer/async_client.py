@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from functools import partial
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from pywisetransfer import BaseClient, LazyResource
+from pywisetransfer.base import Base, get_domain
+from pywisetransfer.cache import MISSING
+from pywisetransfer.endpoint import (
+    WiseEndpoint,
+    WiseEndpointWithSCA,
+    access_denied,
+    conditional_headers,
+    sca_challenge,
+    sign_challenge,
+    store_validators,
+)
+from pywisetransfer.exceptions import WiseClientConfigurationException
+from pywisetransfer.ratelimit import parse_retry_after
+
+if TYPE_CHECKING:
+    from pywisetransfer.bulk import ProfileResult
+    from pywisetransfer.cache import ResponseCache
+    from pywisetransfer.ratelimit import RateLimit
+    from pywisetransfer.retry import RetryPolicy
+    from pywisetransfer.singleflight import AsyncSingleFlight
+
+# Keyword arguments accepted by every endpoint, besides its path placeholders
+ENDPOINT_OPTIONS = frozenset({"method", "params", "data", "json", "headers"})
+
+
+class AsyncService:
+    """Binds the endpoints declared on a ``*Service`` class to an
+    :class:`AsyncClient`, so that each endpoint can be awaited."""
+
+    def __init__(self, client: AsyncClient, service: type[Base]):
+        self.client = client
+        self.service = service
+
+    def __getattr__(self, name: str) -> Any:
+        endpoint = vars(self.service).get(name)
+        if not isinstance(endpoint, WiseEndpoint):
+            raise AttributeError(f"{self.service.__name__} has no endpoint {name!r}")
+        options = ENDPOINT_OPTIONS.union(endpoint.path_placeholders)
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            # Endpoints take path placeholders and request options, rather
+            # than the arguments of the synchronous resource wrappers
+            unknown = sorted(set(kwargs) - options)
+            if unknown:
+                raise TypeError(
+                    f"{self.service.__name__}.{name}() got unexpected keyword arguments: "
+                    + ", ".join(unknown)
+                )
+            data = await self.client.call(endpoint, *args, **kwargs)
+            method = kwargs.get("method") or endpoint.default_method
+            return self.client.convert(data, endpoint.path, method)
+
+        return call
+
+    def __repr__(self) -> str:
+        return f"AsyncService({self.service.__name__})"
+
+
+class LazyAsyncService(LazyResource):
+    def build(self, client: BaseClient) -> AsyncService:
+        service = getattr(import_module(self.module), self.name)
+        return AsyncService(client, service)  # type: ignore[arg-type]
+
+
+class AsyncClient(BaseClient):
+    """An asynchronous client that awaits the endpoints declared by each
+    ``*Service`` class directly, using a pooled ``httpx.AsyncClient``.
+
+    The synchronous resource wrappers, such as ``Client.profiles.list(type=...)``,
+    are not available; each attribute here exposes the endpoints of a service,
+    which take path placeholders and ``params`` as keyword arguments.
+    """
+
+    account_details = LazyAsyncService("pywisetransfer.account_details", "AccountDetailsService")
+    balance_statements = LazyAsyncService(
+        "pywisetransfer.balance_statements", "BalanceStatementsService"
+    )
+    balances = LazyAsyncService("pywisetransfer.balances", "BalancesService")
+    multi_currency_account = LazyAsyncService(
+        "pywisetransfer.multi_currency_account", "MultiCurrencyAccountService"
+    )
+    profiles = LazyAsyncService("pywisetransfer.profile", "ProfileService")
+    subscriptions = LazyAsyncService("pywisetransfer.subscription", "SubscriptionService")
+    users = LazyAsyncService("pywisetransfer.user", "UserService")
+
+    def __init__(
+        self,
+        api_key: str,
+        environment: str = "sandbox",
+        private_key_file: str | None = None,
+        private_key_data: bytes | None = None,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        timeout: float = 10.0,
+        transport: Any = None,
+        sca_approval_ttl: float = 300.0,
+        response_mode: str = "munch",
+        json_backend: str = "json",
+        cache: ResponseCache | None = None,
+        max_validators: int = 256,
+        coalesce_requests: bool = False,
+        rate_limits: dict[str, RateLimit] | None = None,
+        retry: RetryPolicy | None = None,
+        base_url: str | None = None,
+    ):
+        try:
+            import httpx
+        except ImportError:
+            raise WiseClientConfigurationException(
+                "Please install pywisetransfer[async] to use pywisetransfer.AsyncClient"
+            )
+
+        super().__init__(
+            api_key=api_key,
+            environment=environment,
+            private_key_file=private_key_file,
+            private_key_data=private_key_data,
+            sca_approval_ttl=sca_approval_ttl,
+            response_mode=response_mode,
+            json_backend=json_backend,
+            cache=cache,
+            max_validators=max_validators,
+            coalesce_requests=coalesce_requests,
+            rate_limits=rate_limits,
+            retry=retry,
+            base_url=base_url,
+        )
+        self.http = httpx.AsyncClient(
+            base_url=self.base_url or get_domain(environment),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+            transport=transport,
+        )
+
+    def _create_single_flight(self) -> AsyncSingleFlight:
+        from pywisetransfer.singleflight import AsyncSingleFlight
+
+        return AsyncSingleFlight()
+
+    async def bulk_balances(
+        self,
+        profile_ids: Iterable[Any],
+        types: str | list[str] = "STANDARD",
+        max_concurrency: int = 8,
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import gather
+
+        params = {"types": types if isinstance(types, str) else ",".join(types)}
+        return await gather(
+            lambda p: self.balances.list(profile_id=p, params=params), profile_ids, max_concurrency
+        )
+
+    async def bulk_account_details(
+        self, profile_ids: Iterable[Any], max_concurrency: int = 8
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import gather
+
+        return await gather(
+            lambda p: self.account_details.list(profile_id=p), profile_ids, max_concurrency
+        )
+
+    async def bulk_subscriptions(
+        self, profile_ids: Iterable[Any], max_concurrency: int = 8
+    ) -> dict[Any, ProfileResult]:
+        from pywisetransfer.bulk import gather
+
+        return await gather(
+            lambda p: self.subscriptions.list(profile_id=p), profile_ids, max_concurrency
+        )
+
+    def service(self, service: type[Base]) -> AsyncService:
+        return AsyncService(self, service)
+
+    async def call(
+        self,
+        endpoint: WiseEndpoint,
+        method: str | None = None,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json: Any = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        method = method or endpoint.default_method
+        key = endpoint.request_key(self, (), {"method": method, "params": params, **kwargs})
+        cache = self.cache if endpoint.cache_ttl else None
+        if key is not None and cache is not None:
+            cached = cache.get(key)
+            if cached is not MISSING:
+                return cached
+
+        request = partial(
+            self.http.request,
+            method,
+            endpoint.get_formatted_path(**kwargs),
+            params=endpoint.get_merged_params(params),
+            data=data,
+            json=json,
+        )
+        fetch = partial(
+            self._fetch, endpoint, method, key if endpoint.conditional else None, request, headers
+        )
+        if key is not None and self.single_flight is not None:
+            result = await self.single_flight.do(key, fetch)
+        else:
+            result = await fetch()
+        if key is not None and cache is not None:
+            cache.set(key, result, endpoint.cache_ttl)  # type: ignore[arg-type]
+        return result
+
+    async def _fetch(
+        self,
+        endpoint: WiseEndpoint,
+        method: str,
+        validator_key: str | None,
+        request: Callable[..., Awaitable[Any]],
+        headers: dict[str, str] | None,
+    ) -> Any:
+        # Conditional endpoints revalidate the last response received, and
+        # reuse its decoded body when the server reports it is unmodified
+        stored: Any = self.validators.get(validator_key) if validator_key else MISSING
+        if stored is not MISSING:
+            headers = conditional_headers(stored, headers)
+
+        response = await self._send(endpoint, method, request, headers)
+        if response.status_code == 304 and stored is not MISSING:
+            return stored[2]
+
+        response.raise_for_status()
+        timer = endpoint._timer(self, {"method": method}, "decode")
+        if timer is None:
+            data = self.json_loads(response.content)
+        else:
+            with timer as timing:
+                timing.status = response.status_code
+                data = self.json_loads(response.content)
+        store_validators(self, validator_key, response.headers, data)
+        return data
+
+    async def _send(
+        self,
+        endpoint: WiseEndpoint,
+        method: str,
+        request: Callable[..., Awaitable[Any]],
+        headers: dict[str, str] | None,
+    ) -> Any:
+        request_headers = {
+            **(headers or {}),
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+        limiter = self.rate_limiter
+        bucket = limiter.bucket(endpoint.rate_limit_family) if limiter else None
+        policy = self.retry_policy
+
+        async def send_limited(
+            headers: dict[str, str], deadline: float | None = None, **options: Any
+        ) -> Any:
+            if limiter is None or bucket is None:
+                return await request(headers=headers, **options)
+
+            rejected = None
+            for attempt in itertools.count():
+                delay = bucket.reserve()
+                # As for RateLimiter.call, a rejected request is not retried
+                # if it could not be sent before the deadline
+                if rejected is not None and limiter.past_deadline(delay, deadline):
+                    return rejected
+                await asyncio.sleep(delay)
+                response = await request(headers=headers, **options)
+                if response.status_code == 429 and attempt < limiter.max_retries:
+                    bucket.throttle(parse_retry_after(response.headers.get("Retry-After")))
+                    rejected = response
+                    continue
+                bucket.update(response.headers)
+                return response
+
+        async def send(sca_headers: dict[str, str]) -> Any:
+            headers = {**request_headers, **sca_headers}
+            if policy is None:
+                return await send_limited(headers)
+
+            import httpx
+
+            deadline = policy.start()
+            for attempt in itertools.count(1):
+                options = {}
+                if deadline is not None:
+                    options["timeout"] = self._remaining_timeout(deadline)
+                try:
+                    response = await send_limited(headers, deadline, **options)
+                except httpx.TransportError as e:
+                    sent = not isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                    delay = policy.retry_delay(method, attempt, sent=sent, deadline=deadline)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code not in policy.retry_statuses:
+                        return response
+                    delay = policy.retry_delay(
+                        method,
+                        attempt,
+                        status_code=response.status_code,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+                        deadline=deadline,
+                    )
+                    if delay is None:
+                        return response
+                await asyncio.sleep(delay)
+
+        async def timed_send(sca_headers: dict[str, str]) -> Any:
+            timer = endpoint._timer(self, {"method": method}, "request")
+            if timer is None:
+                return await send(sca_headers)
+            with timer as timing:
+                response = await send(sca_headers)
+                timing.status = response.status_code
+                timing.size = len(response.content)
+                timing.elapsed = response.elapsed.total_seconds()
+            return response
+
+        # As for WiseEndpointWithSCA, only endpoints that require SCA send a
+        # recent approval, and sign the challenge when Wise rejects it
+        sca = isinstance(endpoint, WiseEndpointWithSCA)
+        response = await timed_send(self.sca.headers if sca else {})
+        if response.status_code == 403:
+            challenge = sca_challenge(response.status_code, response.headers) if sca else None
+            if challenge is None:
+                raise access_denied(response.json())
+            timer = endpoint._timer(self, {"method": method}, "sca_sign")
+            if timer is None:
+                sca_headers = sign_challenge(self, challenge)
+            else:
+                with timer as timing:
+                    timing.status = response.status_code
+                    sca_headers = sign_challenge(self, challenge)
+            response = await timed_send(sca_headers)
+        return response
+
+    def _remaining_timeout(self, deadline: float) -> Any:
+        import httpx
+
+        remaining = max(deadline - time.monotonic(), 0.001)
+        timeout = self.http.timeout
+        return httpx.Timeout(
+            connect=min(timeout.connect or remaining, remaining),
+            read=min(timeout.read or remaining, remaining),
+            write=min(timeout.write or remaining, remaining),
+            pool=min(timeout.pool or remaining, remaining),
+        )
+
+    async def aclose(self) -> None:
+        await self.http.aclose()
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
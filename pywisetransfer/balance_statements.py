@@ -1,16 +1,53 @@
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpointWithSCA
+from pywisetransfer.streaming import iter_json_array
+
+# Wise rejects statement requests that span more than 469 days
+MAX_STATEMENT_INTERVAL = timedelta(days=469)
+
+
+def parse_timestamp(value: str | datetime) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def format_timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def split_interval(
+    start: datetime, end: datetime, max_interval: timedelta = MAX_STATEMENT_INTERVAL
+) -> list[tuple[datetime, datetime]]:
+    step = timedelta(milliseconds=1)
+    windows = []
+    while start <= end:
+        window_end = min(start + max_interval - step, end)
+        windows.append((start, window_end))
+        start = window_end + step
+    return windows
 
 
 class BalanceStatementsService(Base):
     statement = WiseEndpointWithSCA(
         path="/v1/profiles/{profile_id}/balance-statements/{balance_id}/statement.json",
         required_params=["currency", "intervalStart", "intervalEnd"],
+        rate_limit_family="statements",
+    )
+    statement_stream = WiseEndpointWithSCA(
+        path="/v1/profiles/{profile_id}/balance-statements/{balance_id}/statement.json",
+        required_params=["currency", "intervalStart", "intervalEnd"],
+        return_raw_response_object=True,
+        streaming=True,
+        rate_limit_family="statements",
     )
 
 
@@ -31,7 +68,7 @@ class BalanceStatements:
         if type not in valid_types:
             raise ValueError(f"Invalid type '{type}'; value values are: {valid_types}")
 
-        return munchify(
+        return self.service.convert(
             self.service.statement(
                 profile_id=profile_id,
                 balance_id=balance_id,
@@ -41,5 +78,100 @@ class BalanceStatements:
                     "intervalEnd": interval_end,
                     "type": type,
                 },
-            )
+            ),
+            "statement",
+        )
+
+    def iter_transactions(
+        self,
+        profile_id: str,
+        balance_id: str,
+        currency: str,
+        interval_start: str,
+        interval_end: str,
+        type: str = "COMPACT",
+        chunk_size: int = 65536,
+    ) -> Iterator[Any]:
+        """Yield the transactions of a balance statement one at a time, while
+        the response body is still being received, so that memory use does
+        not grow with the length of the statement.
+
+        The type is validated, and the request sent, when this is called;
+        the transactions are then read as the iterator is consumed."""
+        valid_types = ["COMPACT", "FLAT"]
+        if type not in valid_types:
+            raise ValueError(f"Invalid type '{type}'; value values are: {valid_types}")
+
+        response = self.service.statement_stream(
+            profile_id=profile_id,
+            balance_id=balance_id,
+            params={
+                "currency": currency,
+                "intervalStart": interval_start,
+                "intervalEnd": interval_end,
+                "type": type,
+            },
         )
+        return self._iter_statement(response, chunk_size)
+
+    def _iter_statement(self, response: Any, chunk_size: int) -> Iterator[Any]:
+        try:
+            for transaction in iter_json_array(response.iter_content(chunk_size), "transactions"):
+                yield self.service.convert(transaction, "statement_stream")
+        finally:
+            response.close()
+
+    def transactions(
+        self,
+        profile_id: str,
+        balance_id: str,
+        currency: str,
+        interval_start: str | datetime,
+        interval_end: str | datetime,
+        type: str = "COMPACT",
+        max_interval: timedelta = MAX_STATEMENT_INTERVAL,
+        max_workers: int = 4,
+    ) -> list[Any]:
+        """Retrieve the transactions for a date range of any length, by
+        fetching statements for consecutive windows that Wise accepts.
+
+        The first window is fetched on its own, so that any SCA approval it
+        requires is shared by the remaining windows, which are then fetched
+        concurrently.  Transactions are de-duplicated and returned newest
+        first, matching the order of a single statement.
+        """
+        valid_types = ["COMPACT", "FLAT"]
+        if type not in valid_types:
+            raise ValueError(f"Invalid type '{type}'; value values are: {valid_types}")
+
+        windows = split_interval(
+            parse_timestamp(interval_start), parse_timestamp(interval_end), max_interval
+        )
+
+        def fetch(window: tuple[datetime, datetime]) -> list[Any]:
+            statement = self.service.statement(
+                profile_id=profile_id,
+                balance_id=balance_id,
+                params={
+                    "currency": currency,
+                    "intervalStart": format_timestamp(window[0]),
+                    "intervalEnd": format_timestamp(window[1]),
+                    "type": type,
+                },
+            )
+            return statement.get("transactions") or []
+
+        results = [fetch(windows[0])] if windows else []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results.extend(executor.map(fetch, windows[1:]))
+
+        transactions: dict[tuple[Any, Any, Any], Any] = {}
+        for transaction in (t for result in results for t in result):
+            key = (
+                transaction.get("referenceNumber"),
+                transaction.get("type"),
+                transaction.get("date"),
+            )
+            transactions.setdefault(key, transaction)
+        ordered = sorted(transactions.values(), key=lambda t: t.get("date") or "", reverse=True)
+        return self.service.convert(ordered, "statement")
@@ -1,15 +1,15 @@
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
 
 
 class BalancesService(Base):
-    list = WiseEndpoint(path="/v4/profiles/{profile_id}/balances", required_params=["types"])
-    get = WiseEndpoint(path="/v4/profiles/{profile_id}/balances/{balance_id}")
+    list = WiseEndpoint(
+        path="/v4/profiles/{profile_id}/balances", required_params=["types"], conditional=True
+    )
+    get = WiseEndpoint(path="/v4/profiles/{profile_id}/balances/{balance_id}", conditional=True)
 
 
 class Balances:
@@ -28,7 +28,9 @@ class Balances:
                 raise ValueError(f"Invalid type '{type}'; value values are: {valid_types}")
 
         params = {"types": ",".join(types)}
-        return munchify(self.service.list(profile_id=profile_id, params=params))
+        return self.service.convert(self.service.list(profile_id=profile_id, params=params), "list")
 
     def get(self, profile_id: str, balance_id: str) -> Any:
-        return munchify(self.service.get(profile_id=profile_id, balance_id=balance_id))
+        return self.service.convert(
+            self.service.get(profile_id=profile_id, balance_id=balance_id), "get"
+        )
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+from inspect import getattr_static
 from typing import Any
 
 from apiron import Service
 
 from pywisetransfer import Client
+from pywisetransfer.models import munchify
+
+
+def get_domain(environment: str) -> str:
+    if environment == "live":
+        return "https://api.transferwise.com"
+    return "https://api.sandbox.transferwise.tech"
 
 
 class Base(Service):
@@ -17,15 +25,37 @@ class Base(Service):
         # service base class to retrieve the 'required_headers' property,
         # so we cater for empty arguments here
         # https://github.com/ithaka/apiron/blob/v9.1.0/src/apiron/service/base.py#L9
-        if "client" in kwargs and Base.client != kwargs["client"]:
-            Base.client = kwargs["client"]
-        if Base.client and Base.client.environment == "live":
-            Base.domain = "https://api.transferwise.com"
+        #
+        # The client and domain are bound to each service instance, so that
+        # clients with different credentials can be used concurrently.
+        self.client = kwargs.get("client")
+        if self.client:
+            self.domain = self.client.base_url or get_domain(self.client.environment)
         else:
-            Base.domain = "https://api.sandbox.transferwise.tech"
+            self.domain = get_domain("sandbox")
+
+    def get_hosts(self) -> list[str]:  # type: ignore[override]
+        return [self.domain]
 
     @property
     def required_headers(self) -> dict[str, str]:  # type: ignore[override]
         if self.client:
             return {"Authorization": f"Bearer {self.client.api_key}"}
         return {}
+
+    def convert(self, data: Any, endpoint: str | None = None) -> Any:
+        # Wrap decoded JSON responses in the client's configured response
+        # type; 'endpoint' names the endpoint of this service that returned
+        # the data, which labels the conversion for instrumentation listeners
+        if not self.client:
+            return munchify(data)
+        if endpoint is None or not self.client.listeners:
+            return self.client.convert(data)
+        declared = getattr_static(self, endpoint)
+        return self.client.convert(data, declared.path, declared.default_method)
+
+    def __str__(self) -> str:
+        return self.domain
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(domain={self.domain})"
@@ -1,7 +1,5 @@
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.deprecation import deprecated
@@ -16,6 +14,7 @@ class BorderlessAccountService(Base):
     statement = WiseEndpointWithSCA(
         path="/v3/profiles/{profile_id}/borderless-accounts/{account_id}/statement.json",
         required_params=["currency", "intervalStart", "intervalEnd"],
+        rate_limit_family="statements",
     )
 
 
@@ -28,7 +27,7 @@ class BorderlessAccount:
     )
     def list(self, profile_id: str) -> list[Any]:
         accounts: list[Any] = self.service.list(params={"profileId": profile_id})
-        return munchify(accounts)
+        return self.service.convert(accounts, "list")
 
     @deprecated(
         message="The borderless-accounts statement endpoint is deprecated; please use balance-statements instead"
@@ -41,7 +40,7 @@ class BorderlessAccount:
         interval_start: str,
         interval_end: str,
     ) -> Any:
-        return munchify(
+        return self.service.convert(
             self.service.statement(
                 profile_id=profile_id,
                 account_id=account_id,
@@ -50,5 +49,6 @@ class BorderlessAccount:
                     "intervalStart": interval_start,
                     "intervalEnd": interval_end,
                 },
-            )
+            ),
+            "statement",
         )
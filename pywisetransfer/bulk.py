@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class ProfileResult:
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def fan_out(
+    fn: Callable[[Any], Any], profile_ids: Iterable[Any], max_workers: int = 8
+) -> dict[Any, ProfileResult]:
+    """Call ``fn`` for each profile concurrently, using at most
+    ``max_workers`` threads.
+
+    Results are keyed by profile ID, in the order the IDs were given; a
+    profile whose call fails is reported using the ``error`` attribute of
+    its result, without interrupting the calls for other profiles.
+    """
+    profile_ids = list(dict.fromkeys(profile_ids))
+    if not profile_ids:
+        return {}
+
+    def run(profile_id: Any) -> ProfileResult:
+        try:
+            return ProfileResult(value=fn(profile_id))
+        except Exception as e:
+            return ProfileResult(error=e)
+
+    with ThreadPoolExecutor(min(max_workers, len(profile_ids))) as executor:
+        return dict(zip(profile_ids, executor.map(run, profile_ids)))
+
+
+async def gather(
+    fn: Callable[[Any], Awaitable[Any]], profile_ids: Iterable[Any], max_concurrency: int = 8
+) -> dict[Any, ProfileResult]:
+    """The equivalent of :func:`fan_out` for coroutine functions, awaiting
+    at most ``max_concurrency`` calls at a time."""
+    profile_ids = list(dict.fromkeys(profile_ids))
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(profile_id: Any) -> ProfileResult:
+        async with semaphore:
+            try:
+                return ProfileResult(value=await fn(profile_id))
+            except Exception as e:
+                return ProfileResult(error=e)
+
+    return dict(zip(profile_ids, await asyncio.gather(*map(run, profile_ids))))
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+MISSING = object()
+
+
+class ResponseCache:
+    """Interface for caches of decoded responses from read-mostly endpoints.
+
+    Keys are strings beginning with the identity of the client that made the
+    request, followed by the request path and query; see
+    :meth:`pywisetransfer.endpoint.WiseEndpoint.request_key`.
+    """
+
+    def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+
+    def invalidate(self, prefix: str = "") -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        self.invalidate()
+
+
+class MemoryCache(ResponseCache):
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                del self._entries[key]
+
+
+class SqliteCache(ResponseCache):
+    """A response cache persisted to a SQLite database file, which can be
+    shared between processes on the same host."""
+
+    def __init__(self, path: str, maxsize: int = 10000):
+        # Imported here, since only this cache requires the SQLite extension
+        import sqlite3
+
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, expires_at REAL, accessed_at REAL, value TEXT)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?", (key, now)
+            ).fetchone()
+            if row is None:
+                return MISSING
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, now + ttl, now, json.dumps(value)),
+            )
+            # Evict the least recently used entries, only once there are too
+            # many; both are read from the index on accessed_at
+            (count,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if count > self.maxsize:
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (count - self.maxsize,),
+                )
+
+    def invalidate(self, prefix: str = "") -> None:
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+            )
+
+    def close(self) -> None:
+        self._db.close()
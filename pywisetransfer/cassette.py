@@ -0,0 +1,186 @@
+"""Record the HTTP interactions of a :class:`pywisetransfer.Client`, and
+replay them later without a network connection.
+
+Replayed responses pass through the same endpoint, decoding and conversion
+code as live ones, which makes cassettes useful for profiling client-side
+overhead with realistic payloads::
+
+    with client.record("statements.cassette"):
+        client.balance_statements.statement(...)
+
+    with client.replay("statements.cassette"):
+        cProfile.run("client.balance_statements.statement(...)")
+
+Cassettes are gzip-compressed JSON lines, one interaction per line.  The
+``Authorization`` request header is not recorded.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import itertools
+import json
+from base64 import b64decode, b64encode
+from collections import defaultdict
+from collections.abc import Iterator
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from pywisetransfer.exceptions import UnrecordedRequest
+from pywisetransfer.session import WiseSession
+
+REDACTED_HEADERS = {"authorization"}
+
+
+def encode_body(body: bytes) -> dict[str, str]:
+    try:
+        return {"body": body.decode()}
+    except UnicodeDecodeError:
+        return {"body": b64encode(body).decode(), "encoding": "base64"}
+
+
+def decode_body(interaction: dict[str, Any]) -> bytes:
+    body = interaction["body"]
+    if interaction.get("encoding") == "base64":
+        return b64decode(body)
+    return body.encode()
+
+
+class RecordingAdapter(BaseAdapter):
+    """Sends requests using another adapter, recording each interaction."""
+
+    def __init__(self, adapter: BaseAdapter):
+        super().__init__()
+        self.adapter = adapter
+        self.interactions: list[dict[str, Any]] = []
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: dict[str, str] | None = None,
+    ) -> Response:
+        response = self.adapter.send(
+            request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies
+        )
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        self.interactions.append(
+            {
+                "request": {
+                    "method": request.method,
+                    "url": request.url,
+                    "headers": {
+                        name: value
+                        for name, value in request.headers.items()
+                        if name.lower() not in REDACTED_HEADERS
+                    },
+                    **encode_body(body if isinstance(body, bytes) else b""),
+                },
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                **encode_body(response.content),
+            }
+        )
+        return response
+
+    def close(self) -> None:
+        self.adapter.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Answers requests from recorded interactions, matched by method and
+    URL.  Interactions for the same request are replayed in the order they
+    were recorded, starting again from the first once all have been used."""
+
+    def __init__(self, interactions: list[dict[str, Any]]):
+        super().__init__()
+        recorded = defaultdict(list)
+        for interaction in interactions:
+            request = interaction["request"]
+            recorded[request["method"], request["url"]].append(
+                (
+                    interaction["status"],
+                    interaction.get("reason"),
+                    CaseInsensitiveDict(interaction["headers"]),
+                    decode_body(interaction),
+                )
+            )
+        self._replays: dict[tuple[str, str], Iterator[Any]] = {
+            key: itertools.cycle(responses) for key, responses in recorded.items()
+        }
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: dict[str, str] | None = None,
+    ) -> Response:
+        replay = self._replays.get((request.method or "", request.url or ""))
+        if replay is None:
+            raise UnrecordedRequest(f"No recorded response for {request.method} {request.url}")
+
+        status, reason, headers, body = next(replay)
+        response = Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self  # type: ignore[assignment]
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class Cassette:
+    """Installs a recording or replaying adapter on a client's session
+    until it is closed.  A recording is written to ``path`` on close."""
+
+    def __init__(self, session: WiseSession, path: str, mode: str):
+        self.session = session
+        self.path = path
+        self.mode = mode
+        self.adapter: RecordingAdapter | ReplayAdapter
+        if mode == "record":
+            self.adapter = RecordingAdapter(session.adapter)
+        else:
+            self.adapter = ReplayAdapter(list(load(path)))
+        session.install_adapter(self.adapter)
+
+    def close(self) -> None:
+        self.session.install_adapter(self.session.adapter)
+        if isinstance(self.adapter, RecordingAdapter):
+            save(self.path, self.adapter.interactions)
+
+    def __enter__(self) -> Cassette:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def save(path: str, interactions: list[dict[str, Any]]) -> None:
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for interaction in interactions:
+            f.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+
+
+def load(path: str) -> Iterator[dict[str, Any]]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
@@ -1,50 +1,50 @@
 from __future__ import annotations
 
+import sys
 import warnings
+from functools import wraps
+from typing import Any, Callable
 
 
-class deprecated:
-    """Decorator to indicate that a method is deprecated, with an optional
-    message to emit in the warning.
+def _message(message: str | None = None) -> str | None:
+    return message
 
-    Written following guidance from:
-    https://blog.miguelgrinberg.com/post/the-ultimate-guide-to-python-decorators-part-iii-decorators-with-arguments
-    """
 
-    @staticmethod
-    def _message(message=None, *args, **kwargs):
-        return message
-
-    def __init__(self, *args, **kwargs):
-        self.f = None
-        if len(args) == 1 and callable(args[0]):
-            orig, args = args[0], args[1:]
-            exec(
-                f"""
-class deprecated:
-    @staticmethod
-    def {orig.__name__}(*args, **kwargs):
-        self._emit_warning()
-        return orig(*args, **kwargs)  # may implicitly include 'self' instance argument
-
-self.f = deprecated.{orig.__name__}  # adds a 'deprecated.' prefix to the function repr
-                """,
-                locals(),
-            )
-        self.message = self._message(*args, **kwargs)
-
-    def _emit_warning(self):
-        warnings.warn(self.message, DeprecationWarning, stacklevel=3)
-
-    def __call__(self, *args, **kwargs):
-        if self.f:
-            return self.f(*args, **kwargs)
-        else:
-            assert len(args) == 1 and callable(args[0])
-            return deprecated(args[0], message=self.message).f
-
-    def __repr__(self):
-        if self.f:
-            return repr(self.f)
-        else:
-            return f"<deprecation decorator ({self.message!r})>"
+def _deprecate(f: Callable[..., Any], message: str | None) -> Callable[..., Any]:
+    # Call sites that have already been warned, as (filename, line) pairs
+    warned: set[tuple[str, int]] = set()
+
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        caller = sys._getframe(1)
+        site = (caller.f_code.co_filename, caller.f_lineno)
+        if site not in warned:
+            warnings.warn(str(message), DeprecationWarning, stacklevel=2)
+            warned.add(site)
+        return f(*args, **kwargs)  # may implicitly include 'self' instance argument
+
+    wrapper.__qualname__ = f"deprecated.{f.__name__}"  # prefixes the function repr
+    return wrapper
+
+
+class _DeprecationDecorator:
+    def __init__(self, message: str | None):
+        self.message = message
+
+    def __call__(self, f: Callable[..., Any]) -> Callable[..., Any]:
+        return _deprecate(f, self.message)
+
+    def __repr__(self) -> str:
+        return f"<deprecation decorator ({self.message!r})>"
+
+
+def deprecated(*args: Any, **kwargs: Any) -> Any:
+    """Decorator to indicate that a function or method is deprecated, with an
+    optional message to emit in the warning.
+
+    The warning is emitted at most once for each place the function is
+    called from, so that deprecated functions remain cheap to call in loops.
+    """
+    if len(args) >= 1 and callable(args[0]):
+        return _deprecate(args[0], _message(*args[1:], **kwargs))
+    return _DeprecationDecorator(_message(*args, **kwargs))
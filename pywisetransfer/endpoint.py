@@ -1,24 +1,209 @@
 from __future__ import annotations
 
+import math
 from functools import partial, update_wrapper, wraps
 from typing import Any, Callable
+from urllib.parse import urlencode
 
 import apiron
+from apiron import Timeout
+from apiron.client import DEFAULT_TIMEOUT
 from apiron.endpoint import JsonEndpoint
 from requests.exceptions import HTTPError
 
+from pywisetransfer import BaseClient, Client
 from pywisetransfer.base import Base
+from pywisetransfer.cache import MISSING
 from pywisetransfer.exceptions import (
     WiseAccessDeniedException,
     WiseClientConfigurationException,
 )
-from pywisetransfer.signing import sign_sca_challenge
+from pywisetransfer.instrumentation import Timer
+
+
+def access_denied(data: dict[str, Any]) -> WiseAccessDeniedException:
+    return WiseAccessDeniedException(code=data["code"], message=data["message"])
+
+
+def sca_challenge(status_code: int, headers: Any) -> str | None:
+    if status_code == 403 and headers.get("X-2FA-Approval-Result") == "REJECTED":
+        return headers["X-2FA-Approval"]
+    return None
+
+
+def sign_challenge(client: BaseClient, challenge: str) -> dict[str, str]:
+    if client.private_key is None:
+        raise WiseClientConfigurationException(
+            "Please provide pytransferwise.private_key_file or private_key_data to perform SCA authentication"
+        )
+    from pywisetransfer.signing import sign_sca_challenge
+
+    private_key = client.private_key
+    return client.sca.sign(challenge, lambda c: sign_sca_challenge(c, private_key))
+
+
+def conditional_headers(stored: Any, headers: dict[str, str] | None) -> dict[str, str]:
+    """Add the validators of a stored response to request headers, so that
+    the server can report that the response is unmodified."""
+    etag, last_modified, _ = stored
+    headers = dict(headers or {})
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def store_validators(
+    client: BaseClient, validator_key: str | None, headers: Any, data: Any
+) -> None:
+    etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+    if validator_key is not None and (etag or last_modified):
+        client.validators.set(validator_key, (etag, last_modified, data), ttl=math.inf)
 
 
 class WiseEndpoint(JsonEndpoint):
+    def __init__(
+        self,
+        *args: Any,
+        streaming: bool = False,
+        cache_ttl: float | None = None,
+        conditional: bool = False,
+        rate_limit_family: str = "default",
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        # apiron requests an incrementally-readable response body for
+        # endpoints that have a truthy 'streaming' attribute
+        self.streaming = streaming
+        self.cache_ttl = cache_ttl
+        self.conditional = conditional
+        self.rate_limit_family = rate_limit_family
+
+    def request_key(
+        self, client: BaseClient, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> str | None:
+        """Identify a GET request by the calling client, its formatted path
+        and its query parameters.  Other requests are not identified."""
+        if args or (kwargs.get("method") or self.default_method) != "GET":
+            return None
+        try:
+            path = self.path.format(**{name: kwargs[name] for name in self.path_placeholders})
+        except KeyError:
+            return None
+        params = {**self.default_params, **(kwargs.get("params") or {})}
+        return f"{client.identity}:{path}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def _caller(self, service: Base) -> Callable[..., Any]:
+        client = service.client
+        if client is None:
+            unbound = partial(apiron.client.call, service, self)
+            update_wrapper(unbound, apiron.client.call)
+            return unbound
+
+        timeout = Timeout(*client.timeout) if client.timeout else None
+        call = partial(
+            apiron.client.call, service, self, session=client.session, timeout_spec=timeout
+        )
+        if client.retry_policy is not None:
+            # Each retry is paced by the rate limiter, within the call deadline
+            timeout = timeout or self.timeout_spec or DEFAULT_TIMEOUT
+            call = partial(
+                client.retry_policy.call,
+                self.default_method,
+                timeout,
+                call,
+                rate_limiter=client.rate_limiter,
+                rate_limit_family=self.rate_limit_family,
+            )
+        elif client.rate_limiter is not None:
+            call = partial(client.rate_limiter.call, self.rate_limit_family, call)
+
+        # Responses are decoded from their raw bytes using the client's JSON
+        # backend, rather than by apiron's JsonEndpoint.format_response
+        @wraps(apiron.client.call)
+        def caller(
+            *args: Any, return_raw_response_object: bool | None = None, **kwargs: Any
+        ) -> Any:
+            if return_raw_response_object is None:
+                return_raw_response_object = self.return_raw_response_object
+            if return_raw_response_object:
+                timer = self._timer(client, kwargs, "request")
+                if timer is None:
+                    return call(*args, return_raw_response_object=True, **kwargs)
+                with timer as timing:
+                    response = call(*args, return_raw_response_object=True, **kwargs)
+                    timing.status = response.status_code
+                    timing.elapsed = response.elapsed.total_seconds()
+                return response
+
+            key = self.request_key(client, args, kwargs)
+            cache = client.cache if self.cache_ttl else None
+            if key is not None and cache is not None:
+                data = cache.get(key)
+                if data is not MISSING:
+                    return data
+
+            fetch = partial(
+                self._fetch, client, call, key if self.conditional else None, args, kwargs
+            )
+            if key is not None and client.single_flight is not None:
+                data = client.single_flight.do(key, fetch)
+            else:
+                data = fetch()
+            if key is not None and cache is not None:
+                cache.set(key, data, self.cache_ttl)  # type: ignore[arg-type]
+            return data
+
+        return caller
+
+    def _fetch(
+        self,
+        client: Client,
+        call: Callable[..., Any],
+        validator_key: str | None,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        # Conditional endpoints revalidate the last response received, and
+        # reuse its decoded body when the server reports it is unmodified
+        stored: Any = client.validators.get(validator_key) if validator_key else MISSING
+        if stored is not MISSING:
+            kwargs = {**kwargs, "headers": conditional_headers(stored, kwargs.get("headers"))}
+
+        timer = self._timer(client, kwargs, "request")
+        if timer is None:
+            response = call(*args, return_raw_response_object=True, **kwargs)
+        else:
+            with timer as timing:
+                response = call(*args, return_raw_response_object=True, **kwargs)
+                timing.status = response.status_code
+                timing.size = len(response.content)
+                timing.elapsed = response.elapsed.total_seconds()
+        if response.status_code == 304 and stored is not MISSING:
+            return stored[2]
+
+        timer = self._timer(client, kwargs, "decode")
+        if timer is None:
+            data = client.json_loads(response.content)
+        else:
+            with timer as timing:
+                timing.status = response.status_code
+                data = client.json_loads(response.content)
+        store_validators(client, validator_key, response.headers, data)
+        return data
+
+    def _timer(self, client: BaseClient, kwargs: dict[str, Any], phase: str) -> Timer | None:
+        """Return a timer for a phase of a call, when the client has
+        instrumentation listeners; otherwise nothing is measured."""
+        if not client.listeners:
+            return None
+        method = kwargs.get("method") or self.default_method
+        return Timer(client.listeners, self.path, method, phase)
+
     def __get__(self, instance: Base | None, owner: type[Base]) -> Callable[..., Any]:
-        caller = partial(apiron.client.call, owner, self)
-        update_wrapper(caller, apiron.client.call)
+        service = instance if instance is not None else owner()
+        caller = self._caller(service)
 
         @wraps(apiron.client.call)
         def error_handler(*args: Any, **kwargs: Any) -> Any:
@@ -27,48 +212,40 @@ class WiseEndpoint(JsonEndpoint):
             except HTTPError as e:
                 resp = e.response
                 if resp.status_code == 403:
-                    data = resp.json()
-                    code, message = data["code"], data["message"]
-                    raise WiseAccessDeniedException(code=code, message=message)
+                    raise access_denied(resp.json())
                 raise
 
         return error_handler
 
 
 class WiseEndpointWithSCA(WiseEndpoint):
-    def __init__(self, *args: Any, **kwargs: Any):
-        super().__init__(*args, **kwargs)
-        self.sca_headers: dict[str, str] = {}
-
-    # apiron's required_headers should be called override_headers
-    @property
-    def required_headers(self) -> dict[str, str]:
-        # It looks like 2FA only needs to be performed every few minutes,
-        # but there seems to be no harm in re-sending the signature.
-        return {**super().required_headers, **self.sca_headers}
-
     def __get__(self, instance: Base | None, owner: type[Base]) -> Callable[..., Any]:
-        caller = partial(apiron.client.call, owner, self)
-        update_wrapper(caller, apiron.client.call)
+        service = instance if instance is not None else owner()
+        caller = self._caller(service)
 
         @wraps(apiron.client.call)
-        def perform_2fa_if_needed(*args: Any, **kwargs: Any) -> Any:
+        def perform_2fa_if_needed(
+            *args: Any, headers: dict[str, str] | None = None, **kwargs: Any
+        ) -> Any:
+            # A recent approval is sent up-front; the challenge is only
+            # re-signed when Wise rejects it, typically after expiry
+            client = service.client
+            sca_headers = client.sca.headers if client else {}
             try:
-                return caller(*args, **kwargs)
+                return caller(*args, headers={**sca_headers, **(headers or {})}, **kwargs)
             except HTTPError as e:
                 resp = e.response
-                if resp.status_code == 403 and resp.headers["X-2FA-Approval-Result"] == "REJECTED":
-                    challenge = resp.headers["X-2FA-Approval"]
-                    if owner.client.private_key_data is None:  # type: ignore[union-attr]
-                        raise WiseClientConfigurationException(
-                            "Please provide pytransferwise.private_key_file or private_key_data to perform SCA authentication"
-                        ) from e
-
-                    self.sca_headers["X-Signature"] = sign_sca_challenge(
-                        challenge, owner.client.private_key_data  # type: ignore[union-attr]
-                    )
-                    self.sca_headers["X-2FA-Approval"] = challenge
-                    return caller(*args, **kwargs)
+                challenge = sca_challenge(resp.status_code, resp.headers)
+                if challenge is not None:
+                    assert client is not None
+                    timer = self._timer(client, kwargs, "sca_sign")
+                    if timer is None:
+                        sca_headers = sign_challenge(client, challenge)
+                    else:
+                        with timer as timing:
+                            timing.status = resp.status_code
+                            sca_headers = sign_challenge(client, challenge)
+                    return caller(*args, headers={**sca_headers, **(headers or {})}, **kwargs)
                 raise
 
         return perform_2fa_if_needed
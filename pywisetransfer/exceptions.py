@@ -28,3 +28,7 @@ class InvalidWebhookRequest(WiseException):
 
 class InvalidWebhookSignature(WiseException):
     pass
+
+
+class UnrecordedRequest(WiseException):
+    pass
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pywisetransfer.exceptions import WiseClientConfigurationException
+
+logger = logging.getLogger(__name__)
+
+# The phases of an endpoint call that are timed
+PHASES = ("request", "decode", "convert", "sca_sign")
+
+
+@dataclass
+class Timing:
+    """The duration of one phase of an endpoint call.
+
+    ``endpoint`` is the path template of the endpoint, such as
+    ``/v1/profiles/{profile_id}``, so that calls can be grouped without
+    including identifiers.  For the ``request`` phase, ``size`` is the
+    length of the response body and ``elapsed`` the time until its headers
+    were received, as measured by requests.
+    """
+
+    endpoint: str
+    method: str
+    phase: str
+    start: float
+    duration: float
+    status: int | None = None
+    size: int | None = None
+    elapsed: float | None = None
+    error: BaseException | None = None
+
+
+Listener = Callable[[Timing], Any]
+
+
+class Timer:
+    """Times a phase of an endpoint call, and reports it to listeners."""
+
+    def __init__(self, listeners: list[Listener], endpoint: str, method: str, phase: str):
+        self.listeners = listeners
+        self.timing = Timing(endpoint, method, phase, start=0.0, duration=0.0)
+
+    def __enter__(self) -> Timing:
+        self.timing.start = time.time()
+        self._started = time.perf_counter()
+        return self.timing
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        self.timing.duration = time.perf_counter() - self._started
+        if exc is not None:
+            self.timing.error = exc
+            response = getattr(exc, "response", None)
+            if self.timing.status is None and response is not None:
+                self.timing.status = response.status_code
+        notify(self.listeners, self.timing)
+
+
+def notify(listeners: list[Listener], timing: Timing) -> None:
+    for listener in listeners:
+        try:
+            listener(timing)
+        except Exception:
+            # Instrumentation must never interfere with the calls it observes
+            logger.exception("pywisetransfer instrumentation listener failed")
+
+
+class OpenTelemetryListener:
+    """Records each timed phase as an OpenTelemetry span, as a child of the
+    span that is current when the phase ends."""
+
+    def __init__(self, tracer: Any = None):
+        try:
+            from opentelemetry import trace  # type: ignore[import-not-found]
+        except ImportError:
+            raise WiseClientConfigurationException(
+                "Please install opentelemetry-api to use pywisetransfer.instrumentation.OpenTelemetryListener"
+            )
+        self.tracer = tracer or trace.get_tracer("pywisetransfer")
+
+    def __call__(self, timing: Timing) -> None:
+        name = f"{timing.method} {timing.endpoint}"
+        if timing.phase != "request":
+            name = f"{name} {timing.phase}"
+        start_ns = int(timing.start * 1e9)
+        span = self.tracer.start_span(name, start_time=start_ns)
+        span.set_attribute("http.request.method", timing.method)
+        span.set_attribute("url.template", timing.endpoint)
+        span.set_attribute("pywisetransfer.phase", timing.phase)
+        if timing.status is not None:
+            span.set_attribute("http.response.status_code", timing.status)
+        if timing.size is not None:
+            span.set_attribute("http.response.body.size", timing.size)
+        if timing.error is not None:
+            span.record_exception(timing.error)
+        span.end(end_time=start_ns + int(timing.duration * 1e9))
+
+
+class PrometheusListener:
+    """Observes each timed phase in a Prometheus histogram, labelled by
+    endpoint path template, method, status and phase, and the size of each
+    response in a second histogram."""
+
+    def __init__(self, registry: Any = None, prefix: str = "pywisetransfer"):
+        try:
+            from prometheus_client import REGISTRY, Histogram  # type: ignore[import-not-found]
+        except ImportError:
+            raise WiseClientConfigurationException(
+                "Please install prometheus-client to use pywisetransfer.instrumentation.PrometheusListener"
+            )
+        registry = registry or REGISTRY
+        labels = ["endpoint", "method", "status", "phase"]
+        self.durations = Histogram(
+            f"{prefix}_call_duration_seconds",
+            "Duration of each phase of Wise API calls",
+            labels,
+            registry=registry,
+        )
+        self.sizes = Histogram(
+            f"{prefix}_response_size_bytes",
+            "Size of Wise API response bodies",
+            labels[:3],
+            buckets=[2**n for n in range(8, 26, 2)],
+            registry=registry,
+        )
+
+    def __call__(self, timing: Timing) -> None:
+        status = str(timing.status) if timing.status is not None else ""
+        labels = (timing.endpoint, timing.method, status)
+        self.durations.labels(*labels, timing.phase).observe(timing.duration)
+        if timing.size is not None:
+            self.sizes.labels(*labels).observe(timing.size)
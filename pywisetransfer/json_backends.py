@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from pywisetransfer.exceptions import WiseClientConfigurationException
+
+
+def _orjson() -> Callable[[bytes], Any]:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Callable[[bytes], Any]:
+    import msgspec  # type: ignore[import-not-found]
+
+    return msgspec.json.decode
+
+
+def _ujson() -> Callable[[bytes], Any]:
+    import ujson  # type: ignore[import-untyped]
+
+    return ujson.loads
+
+
+def _json() -> Callable[[bytes], Any]:
+    return json.loads
+
+
+JSON_BACKENDS: dict[str, Callable[[], Callable[[bytes], Any]]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "ujson": _ujson,
+    "json": _json,
+}
+
+
+def get_json_loads(backend: str = "json") -> Callable[[bytes], Any]:
+    """Return a function that decodes JSON directly from response bytes.
+
+    The ``"auto"`` backend selects the first installed backend, in the
+    order listed in :data:`JSON_BACKENDS`, falling back to :mod:`json`.
+    """
+    if backend == "auto":
+        for loader in JSON_BACKENDS.values():
+            try:
+                return loader()
+            except ImportError:
+                continue
+
+    if backend not in JSON_BACKENDS:
+        raise WiseClientConfigurationException(
+            f"pywisetransfer.json_backend must be 'auto' or one of {sorted(JSON_BACKENDS)}"
+        )
+    try:
+        return JSON_BACKENDS[backend]()
+    except ImportError:
+        raise WiseClientConfigurationException(
+            f"pywisetransfer.json_backend {backend!r} is not installed"
+        )
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import keyword
+from collections.abc import Callable, ItemsView, Iterator, ValuesView
+from dataclasses import asdict, make_dataclass
+from functools import lru_cache
+from typing import Any
+
+
+class Record:
+    """Base class for the compact, ``__slots__``-based response objects
+    produced by :func:`structify`.
+
+    Fields are read as attributes, as with :class:`munch.Munch`; simple
+    mapping-style lookups are supported for convenience.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key in self.__dataclass_fields__  # type: ignore[attr-defined]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__dataclass_fields__)  # type: ignore[attr-defined]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default) if key in self else default
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)  # type: ignore[call-overload, no-any-return]
+
+
+# Objects with more fields than this are left as plain dicts, since they are
+# typically keyed by identifiers, such as currency codes, rather than names
+MAX_RECORD_FIELDS = 64
+
+
+@lru_cache(maxsize=512)
+def _record_type(fields: tuple[str, ...]) -> type[Record] | None:
+    # One record type is generated, and then reused, for each distinct
+    # set of response fields; the least recently used types are discarded
+    # so that responses of varying shape do not accumulate types.  Objects
+    # whose keys cannot be used as attribute names, or would replace the
+    # methods of Record, are left as plain dicts
+    if len(fields) > MAX_RECORD_FIELDS:
+        return None
+    if all(
+        f.isidentifier() and not keyword.iskeyword(f) and f[0] != "_" and not hasattr(Record, f)
+        for f in fields
+    ):
+        return make_dataclass("Record", fields, bases=(Record,), slots=True)
+    return None
+
+
+def structify(data: Any) -> Any:
+    if isinstance(data, dict):
+        record_type = _record_type(tuple(data))
+        if record_type is None:
+            return {key: structify(value) for key, value in data.items()}
+        return record_type(*[structify(value) for value in data.values()])
+    if isinstance(data, list):
+        return [structify(value) for value in data]
+    return data
+
+
+class LazyMunch(dict):
+    """A dict with :class:`munch.Munch`-style attribute access, which wraps
+    nested objects only when they are first accessed."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        value = dict.__getitem__(self, key)
+        wrapped = lazify(value)
+        if wrapped is not value:
+            dict.__setitem__(self, key, wrapped)
+        return wrapped
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self[name] = value
+
+    def __delattr__(self, name: str) -> None:
+        try:
+            del self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        return LazyValuesView(self)
+
+    def items(self) -> ItemsView[Any, Any]:  # type: ignore[override]
+        return LazyItemsView(self)
+
+    def copy(self) -> LazyMunch:
+        # As with Munch, nested objects are copied too
+        return LazyMunch(_unwrap(self))
+
+    def toDict(self) -> dict[Any, Any]:
+        return {key: _unwrap(value) for key, value in dict.items(self)}
+
+
+class LazyValuesView(ValuesView):
+    """A view of the values of a :class:`LazyMunch`, wrapped on access."""
+
+    __slots__ = ()
+    _mapping: LazyMunch
+
+    def __iter__(self) -> Iterator[Any]:
+        for key in self._mapping:
+            yield self._mapping[key]
+
+
+class LazyItemsView(ItemsView):
+    """A view of the items of a :class:`LazyMunch`, wrapped on access."""
+
+    __slots__ = ()
+    _mapping: LazyMunch
+
+    def __iter__(self) -> Iterator[tuple[Any, Any]]:
+        for key in self._mapping:
+            yield key, self._mapping[key]
+
+
+class LazyList(list):
+    """A list that wraps nested objects only when they are first accessed."""
+
+    __slots__ = ()
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return LazyList(list.__getitem__(self, index))
+        value = list.__getitem__(self, index)
+        wrapped = lazify(value)
+        if wrapped is not value:
+            list.__setitem__(self, index, wrapped)
+        return wrapped
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _unwrap(item) for key, item in dict.items(value)}
+    if isinstance(value, list):
+        return [_unwrap(item) for item in list.__iter__(value)]
+    return value
+
+
+def lazify(data: Any) -> Any:
+    if isinstance(data, dict) and not isinstance(data, LazyMunch):
+        return LazyMunch(data)
+    if isinstance(data, list) and not isinstance(data, LazyList):
+        return LazyList(data)
+    return data
+
+
+def munchify(data: Any) -> Any:
+    # munch is imported on first use, to keep client construction fast
+    from munch import munchify
+
+    return munchify(data)
+
+
+RESPONSE_MODES: dict[str, Callable[[Any], Any]] = {
+    "lazy": lazify,
+    "munch": munchify,
+    "struct": structify,
+}
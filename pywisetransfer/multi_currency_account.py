@@ -1,7 +1,5 @@
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
@@ -9,7 +7,8 @@ from pywisetransfer.endpoint import WiseEndpoint
 
 class MultiCurrencyAccountService(Base):
     available_currencies = WiseEndpoint(
-        path="/v2/borderless-accounts-configuration/profiles/{profile_id}/available-currencies"
+        path="/v2/borderless-accounts-configuration/profiles/{profile_id}/available-currencies",
+        cache_ttl=3600,
     )
     get = WiseEndpoint(path="/v4/profiles/{profile_id}/multi-currency-account")
 
@@ -19,7 +18,9 @@ class MultiCurrencyAccount:
         self.service = MultiCurrencyAccountService(client=client)
 
     def available_currencies(self, profile_id: str) -> Any:
-        return munchify(self.service.available_currencies(profile_id=profile_id))
+        return self.service.convert(
+            self.service.available_currencies(profile_id=profile_id), "available_currencies"
+        )
 
     def get(self, profile_id: str) -> Any:
-        return munchify(self.service.get(profile_id=profile_id))
+        return self.service.convert(self.service.get(profile_id=profile_id), "get")
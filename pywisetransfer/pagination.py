@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+
+class Paging:
+    """Describes how a list endpoint splits its results into pages: the
+    parameters of the first request, where the items are found in each
+    page, and the parameters that request the page following it."""
+
+    items_key: str | None = None
+
+    def first(self, params: dict[str, Any]) -> dict[str, Any]:
+        return params
+
+    def items(self, page: Any) -> list[Any]:
+        return page if self.items_key is None else page.get(self.items_key) or []
+
+    def next(self, params: dict[str, Any], page: Any) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+
+@dataclass
+class OffsetPaging(Paging):
+    """Pages requested using ``offset`` and ``limit`` query parameters.  A
+    page that is not exactly ``limit`` items long is the last one."""
+
+    limit: int = 100
+    offset_param: str = "offset"
+    limit_param: str = "limit"
+    items_key: str | None = None
+
+    def first(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {self.offset_param: 0, **params, self.limit_param: self.limit}
+
+    def next(self, params: dict[str, Any], page: Any) -> dict[str, Any] | None:
+        count = len(self.items(page))
+        if count != self.limit:
+            return None
+        return {**params, self.offset_param: int(params[self.offset_param]) + count}
+
+
+@dataclass
+class CursorPaging(Paging):
+    """Pages that each include an opaque cursor identifying the next page."""
+
+    items_key: str | None = None
+    cursor_key: str = "cursor"
+    cursor_param: str = "nextCursor"
+    size: int | None = None
+    size_param: str = "size"
+
+    def first(self, params: dict[str, Any]) -> dict[str, Any]:
+        return params if self.size is None else {**params, self.size_param: self.size}
+
+    def next(self, params: dict[str, Any], page: Any) -> dict[str, Any] | None:
+        cursor = page.get(self.cursor_key)
+        if not cursor or not self.items(page):
+            return None
+        return {**params, self.cursor_param: cursor}
+
+
+@dataclass
+class NextPageUrlPaging(Paging):
+    """Pages that each include the URL of the next page; its query
+    parameters are used to request that page from the same endpoint."""
+
+    items_key: str | None = None
+    next_key: str = "nextPageUrl"
+
+    def next(self, params: dict[str, Any], page: Any) -> dict[str, Any] | None:
+        url = page.get(self.next_key)
+        if not url:
+            return None
+        return {**params, **dict(parse_qsl(urlsplit(url).query))}
+
+
+def iter_pages(
+    fetch: Callable[[dict[str, Any]], Any],
+    paging: Paging,
+    params: dict[str, Any] | None = None,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """Yield each page of a list endpoint, calling ``fetch`` with the query
+    parameters of each page in turn.
+
+    With ``prefetch``, the next page is requested in a background thread
+    while the current one is consumed, so that at most two pages are held
+    in memory at any time.
+
+    Iteration also stops if a page repeats the previous one, which happens
+    when an endpoint ignores the paging parameters.
+    """
+    first_params = paging.first(dict(params or {}))
+    next_params: dict[str, Any] | None = first_params
+    previous = None
+    if not prefetch:
+        while next_params is not None:
+            page = fetch(next_params)
+            if page == previous:
+                return
+            next_params, previous = paging.next(next_params, page), page
+            yield page
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        future: Future[Any] | None = executor.submit(fetch, first_params)
+        while future is not None:
+            page = future.result()
+            if page == previous:
+                return
+            assert next_params is not None
+            next_params, previous = paging.next(next_params, page), page
+            future = executor.submit(fetch, next_params) if next_params is not None else None
+            yield page
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_items(
+    fetch: Callable[[dict[str, Any]], Any],
+    paging: Paging,
+    convert: Callable[[Any], Any],
+    params: dict[str, Any] | None = None,
+    prefetch: bool = True,
+) -> Iterator[Any]:
+    """Yield the items of every page of a list endpoint, converted one page
+    at a time."""
+    for page in iter_pages(fetch, paging, params, prefetch):
+        yield from convert(paging.items(page))
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
+from pywisetransfer.pagination import OffsetPaging, iter_items
 
 
 class ProfileService(Base):
-    list = WiseEndpoint(path="/v1/profiles")
-    get = WiseEndpoint(path="/v1/profiles/{profile_id}")
+    list = WiseEndpoint(path="/v1/profiles", cache_ttl=300)
+    get = WiseEndpoint(path="/v1/profiles/{profile_id}", cache_ttl=300)
 
 
 class Profile:
@@ -19,10 +20,21 @@ class Profile:
         self.service = ProfileService(client=client)
 
     def list(self, type: str | None = None) -> list[Any]:
-        profiles: list[Any] = munchify(self.service.list())
+        profiles: list[Any] = self.service.convert(self.service.list(), "list")
         if type is None:
             return profiles
         return [p for p in profiles if p.type == type]
 
+    def iter_profiles(
+        self, type: str | None = None, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[Any]:
+        profiles = iter_items(
+            lambda params: self.service.list(params=params),
+            OffsetPaging(limit=page_size),
+            partial(self.service.convert, endpoint="list"),
+            prefetch=prefetch,
+        )
+        return profiles if type is None else (p for p in profiles if p.type == type)
+
     def get(self, profile_id: str) -> Any:
-        return munchify(self.service.get(profile_id=profile_id))
+        return self.service.convert(self.service.get(profile_id=profile_id), "get")
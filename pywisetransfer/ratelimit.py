@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from requests.exceptions import HTTPError
+
+
+@dataclass
+class RateLimit:
+    """The sustained request rate (per second) and burst size allowed for a
+    family of endpoints."""
+
+    rate: float
+    burst: int = 1
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # HTTP dates are in UTC; a "-0000" offset is parsed as naive
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_rate_limit_reset(headers: Mapping[str, str]) -> float | None:
+    """Return the number of seconds to wait when the rate limit headers of a
+    response report that no requests remain in the current window."""
+    for prefix in ("RateLimit-", "X-RateLimit-"):
+        remaining = headers.get(prefix + "Remaining")
+        reset = headers.get(prefix + "Reset")
+        if remaining is None or reset is None:
+            continue
+        try:
+            if float(remaining) > 0:
+                return None
+            seconds = float(reset)
+        except ValueError:
+            return None
+        # Some servers send the reset time as an epoch timestamp
+        if seconds > 1e9:
+            seconds -= time.time()
+        return max(0.0, seconds)
+    return None
+
+
+class TokenBucket:
+    """A token bucket that hands out send times in the order they are
+    requested, so that callers waiting for capacity are served fairly.
+
+    The rate adapts to the server: it is halved whenever a request is
+    rejected with HTTP 429, and recovers gradually as requests succeed.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        self.max_rate = self.rate = rate
+        self.min_rate = rate / 16
+        self.burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next = clock()
+
+    def reserve(self) -> float:
+        """Reserve the next send slot, returning the delay in seconds until
+        it may be used."""
+        with self._lock:
+            now = self._clock()
+            interval = 1 / self.rate
+            self._next = max(self._next, now)
+            send_at = max(now, self._next - (self.burst - 1) * interval)
+            self._next += interval
+            return send_at - now
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            resume_at = self._clock() + seconds + (self.burst - 1) / self.rate
+            self._next = max(self._next, resume_at)
+
+    def throttle(self, retry_after: float | None) -> None:
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+        self.pause(retry_after if retry_after is not None else 1 / self.rate)
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+        reset = parse_rate_limit_reset(headers)
+        if reset is not None:
+            self.pause(reset)
+
+
+class RateLimiter:
+    """Per-client rate limits for each family of endpoints.  Endpoints whose
+    family has no configured limit use the ``"default"`` limit, if any."""
+
+    def __init__(self, limits: Mapping[str, RateLimit], max_retries: int = 5):
+        self.buckets = {family: TokenBucket(l.rate, l.burst) for family, l in limits.items()}
+        self.max_retries = max_retries
+
+    def bucket(self, family: str) -> TokenBucket | None:
+        return self.buckets.get(family) or self.buckets.get("default")
+
+    def call(
+        self,
+        family: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        deadline: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call ``fn`` when the family's limit allows, retrying requests
+        rejected with HTTP 429.  A rejected request is not retried if it
+        could not be sent before the ``deadline`` (a ``time.monotonic``
+        value), if one is given."""
+        bucket = self.bucket(family)
+        if bucket is None:
+            return fn(*args, **kwargs)
+
+        rejected: HTTPError | None = None
+        for attempt in itertools.count():
+            delay = bucket.reserve()
+            if rejected is not None and self.past_deadline(delay, deadline):
+                raise rejected
+            time.sleep(delay)
+            try:
+                response = fn(*args, **kwargs)
+            except HTTPError as e:
+                if e.response is None or e.response.status_code != 429:
+                    raise
+                if attempt >= self.max_retries:
+                    raise
+                bucket.throttle(parse_retry_after(e.response.headers.get("Retry-After")))
+                rejected = e
+                continue
+            bucket.update(response.headers)
+            return response
+
+    @staticmethod
+    def past_deadline(delay: float, deadline: float | None) -> bool:
+        return deadline is not None and time.monotonic() + delay > deadline
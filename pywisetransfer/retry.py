@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import itertools
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from apiron import Timeout
+from requests.exceptions import (
+    ConnectionError,
+    ConnectTimeout,
+    HTTPError,
+    Timeout as RequestTimeout,
+)
+
+from pywisetransfer.ratelimit import RateLimiter, parse_retry_after
+
+# Requests with these methods can be repeated without changing their effect
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class RetryPolicy:
+    """Retries requests that fail with a transient error: a dropped
+    connection, a timeout or one of the ``retry_statuses``.
+
+    Only requests using one of the ``retry_methods`` are retried, except
+    when the connection could not be established at all, in which case the
+    request was never sent.  Attempts are spaced by exponential backoff with
+    "full jitter", and a ``deadline`` (in seconds) bounds the total time a
+    call may take, including its retries.
+
+    HTTP 429 responses are not retried here; they are handled by the
+    client's rate limiter.
+    """
+
+    max_attempts: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 10.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = frozenset({500, 502, 503, 504})
+    retry_methods: frozenset[str] = SAFE_METHODS
+    deadline: float | None = None
+
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        retry_after: float | None = None,
+        sent: bool = True,
+        deadline: float | None = None,
+    ) -> float | None:
+        """Return the delay before attempting a failed request again, or
+        ``None`` if it should not be retried.
+
+        ``status_code`` is ``None`` when no response was received, and
+        ``sent`` is false when the request never reached the server.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if sent and method.upper() not in self.retry_methods:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+
+        delay = retry_after if retry_after is not None else self.backoff(attempt)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def start(self) -> float | None:
+        return None if self.deadline is None else time.monotonic() + self.deadline
+
+    def call(
+        self,
+        default_method: str,
+        timeout: Timeout,
+        fn: Callable[..., Any],
+        *args: Any,
+        rate_limiter: RateLimiter | None = None,
+        rate_limit_family: str = "default",
+        **kwargs: Any,
+    ) -> Any:
+        """Call an apiron-style ``fn``, retrying transient failures.  Each
+        attempt's timeouts are reduced to fit within the remaining deadline.
+
+        With a ``rate_limiter``, each attempt is paced by it, and requests
+        it retries after HTTP 429 responses are also bound by the deadline.
+        """
+        if rate_limiter is not None:
+            fn = partial(rate_limiter.call, rate_limit_family, fn)
+        method = kwargs.get("method") or default_method
+        deadline = self.start()
+        for attempt in itertools.count(1):
+            timeout_spec = timeout
+            if deadline is not None:
+                remaining = max(deadline - time.monotonic(), 0.001)
+                timeout_spec = Timeout(
+                    min(timeout.connection_timeout, remaining), min(timeout.read_timeout, remaining)
+                )
+            options: dict[str, Any] = {"timeout_spec": timeout_spec}
+            if rate_limiter is not None:
+                options["deadline"] = deadline
+            try:
+                return fn(*args, **options, **kwargs)
+            except HTTPError as e:
+                if e.response is None:
+                    raise
+                delay = self.retry_delay(
+                    method,
+                    attempt,
+                    status_code=e.response.status_code,
+                    retry_after=parse_retry_after(e.response.headers.get("Retry-After")),
+                    deadline=deadline,
+                )
+                if delay is None:
+                    raise
+            except (ConnectionError, RequestTimeout) as e:
+                sent = not isinstance(e, ConnectTimeout)
+                delay = self.retry_delay(method, attempt, sent=sent, deadline=deadline)
+                if delay is None:
+                    raise
+            time.sleep(delay)
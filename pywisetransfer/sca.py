@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class ScaApproval:
+    """The most recently signed SCA challenge for a client.
+
+    Wise accepts a signed challenge for several minutes, so the approval
+    headers are sent with subsequent requests until ``ttl`` seconds have
+    passed, avoiding a rejected request and a re-signing round trip.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        self.ttl = ttl
+        self._approval: tuple[dict[str, str], float] = ({}, 0.0)
+        self._lock = threading.Lock()
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers, expires_at = self._approval
+        return headers if time.monotonic() < expires_at else {}
+
+    def approve(self, challenge: str, signature: str) -> dict[str, str]:
+        headers = {"X-Signature": signature, "X-2FA-Approval": challenge}
+        self._approval = (headers, time.monotonic() + self.ttl)
+        return headers
+
+    def sign(self, challenge: str, signer: Callable[[str], str]) -> dict[str, str]:
+        with self._lock:
+            headers = self.headers
+            if headers.get("X-2FA-Approval") == challenge:
+                return headers
+            return self.approve(challenge, signer(challenge))
+
+    def clear(self) -> None:
+        self._approval = ({}, 0.0)
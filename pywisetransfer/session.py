@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+from apiron.client import DEFAULT_RETRY
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+
+@dataclass
+class ConnectionStats:
+    requests: int = 0
+    connections: int = 0
+
+    @property
+    def reused(self) -> int:
+        return self.requests - self.connections
+
+
+class WiseSession(requests.Session):
+    """A :class:`requests.Session` that keeps a single pooled adapter for the
+    lifetime of a :class:`pywisetransfer.Client`, so that connections to the
+    Wise API are kept alive and reused between calls."""
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        max_retries: Any = DEFAULT_RETRY,
+    ):
+        super().__init__()
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+        )
+        self.install_adapter(self.adapter)
+
+    def install_adapter(self, adapter: BaseAdapter) -> None:
+        super().mount("https://", adapter)
+        super().mount("http://", adapter)
+
+    def mount(self, prefix: str, adapter: BaseAdapter) -> None:
+        # apiron mounts a fresh adapter on the session for every call, which
+        # would discard the pooled connections; keep the installed adapters
+        if prefix not in self.adapters:
+            super().mount(prefix, adapter)
+
+    def connection_stats(self) -> ConnectionStats:
+        stats = ConnectionStats()
+        for adapter in {id(a): a for a in self.adapters.values()}.values():
+            poolmanager = getattr(adapter, "poolmanager", None)
+            if poolmanager is None:
+                continue
+            for key in poolmanager.pools.keys():
+                pool = poolmanager.pools.get(key)
+                if pool is not None:
+                    stats.requests += pool.num_requests
+                    stats.connections += pool.num_connections
+        return stats
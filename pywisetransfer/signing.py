@@ -1,11 +1,22 @@
+from __future__ import annotations
+
 from base64 import b64encode
+from typing import cast
 
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 
-def sign_sca_challenge(challenge: str, private_key_data: bytes) -> str:
-    private_key = load_pem_private_key(private_key_data, None)
-    signature = private_key.sign(challenge.encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+def load_private_key(private_key_data: bytes) -> PrivateKeyTypes:
+    return load_pem_private_key(private_key_data, None)
+
+
+def sign_sca_challenge(challenge: str, private_key: bytes | PrivateKeyTypes) -> str:
+    if isinstance(private_key, bytes):
+        private_key = load_private_key(private_key)
+    # Wise only accepts SCA signatures from RSA keys
+    rsa_key = cast(rsa.RSAPrivateKey, private_key)
+    signature = rsa_key.sign(challenge.encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
     return b64encode(signature).decode("ascii")
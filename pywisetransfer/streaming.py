@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+
+class _IncrementalReader:
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.exhausted = False
+
+    def _read_more(self) -> bool:
+        # Consumed text is discarded whenever more is read, so that the
+        # buffer only holds the value currently being decoded
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buffer = self.buffer[self.pos :] + text
+                self.pos = 0
+                return True
+        self._decoder.decode(b"", final=True)
+        self.exhausted = True
+        return False
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # type: ignore[union-attr]
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buffer, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+                # A value that ends at the end of the buffer may be truncated
+                # (for example a number), unless the input is exhausted
+                if end < len(self.buffer) or self.exhausted:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.exhausted:
+                    raise
+            self._read_more()
+
+
+def iter_json_array(chunks: Iterable[bytes], key: str) -> Iterator[Any]:
+    """Incrementally decode a JSON object from an iterable of byte chunks,
+    yielding each item of the array stored under ``key`` as soon as it has
+    been received.  Decoding stops once the array has been consumed."""
+    reader = _IncrementalReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            reader.expect("[")
+            if reader.peek() == "]":
+                return
+            while True:
+                yield reader.value()
+                if reader.expect(",]") == "]":
+                    return
+        reader.value()
+        if reader.expect(",}") == "}":
+            return
@@ -1,10 +1,11 @@
+from collections.abc import Iterator
+from functools import partial
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
+from pywisetransfer.pagination import OffsetPaging, iter_items
 
 
 class SubscriptionService(Base):
@@ -17,7 +18,19 @@ class Subscription:
         self.service = SubscriptionService(client=client)
 
     def list(self, profile_id: str) -> Any:
-        return munchify(self.service.list(profile_id=profile_id))
+        return self.service.convert(self.service.list(profile_id=profile_id), "list")
+
+    def iter_subscriptions(
+        self, profile_id: str, page_size: int = 100, prefetch: bool = True
+    ) -> Iterator[Any]:
+        return iter_items(
+            lambda params: self.service.list(profile_id=profile_id, params=params),
+            OffsetPaging(limit=page_size),
+            partial(self.service.convert, endpoint="list"),
+            prefetch=prefetch,
+        )
 
     def get(self, profile_id: str, subscription_id: str) -> Any:
-        return munchify(self.service.get(profile_id=profile_id, subscription_id=subscription_id))
+        return self.service.convert(
+            self.service.get(profile_id=profile_id, subscription_id=subscription_id), "get"
+        )
@@ -0,0 +1,372 @@
+"""A local stand-in for the Wise API, for offline tests and load testing.
+
+The server answers every endpoint declared by the ``*Service`` classes with
+generated data, and can inject latency, rate limiting (HTTP 429) and server
+errors, issue SCA challenges for endpoints that require them, and produce
+balance statements of any length::
+
+    with MockWiseServer(latency=0.01, error_rate=0.05) as server:
+        client = server.client(retry=RetryPolicy())
+        client.profiles.list()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qsl, urlsplit
+
+from pywisetransfer import Client
+from pywisetransfer.account_details import AccountDetailsService
+from pywisetransfer.balance_statements import (
+    BalanceStatementsService,
+    format_timestamp,
+    parse_timestamp,
+)
+from pywisetransfer.balances import BalancesService
+from pywisetransfer.borderless_account import BorderlessAccountService
+from pywisetransfer.endpoint import WiseEndpoint, WiseEndpointWithSCA
+from pywisetransfer.multi_currency_account import MultiCurrencyAccountService
+from pywisetransfer.profile import ProfileService
+from pywisetransfer.subscription import SubscriptionService
+from pywisetransfer.user import UserService
+
+SERVICES = [
+    AccountDetailsService,
+    BalanceStatementsService,
+    BalancesService,
+    BorderlessAccountService,
+    MultiCurrencyAccountService,
+    ProfileService,
+    SubscriptionService,
+    UserService,
+]
+
+CURRENCIES = ["EUR", "GBP", "USD"]
+
+Fixture = Callable[[dict[str, str], dict[str, str]], Any]
+
+
+class Route:
+    def __init__(self, template: str, sca: bool):
+        self.template = template
+        self.sca = sca
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(template))
+        self.pattern = re.compile(f"^{pattern}$")
+
+
+def build_routes() -> list[Route]:
+    """Collect the path templates of the endpoints declared by each service,
+    noting which of them require SCA."""
+    routes: dict[str, Route] = {}
+    for service in SERVICES:
+        for endpoint in vars(service).values():
+            if isinstance(endpoint, WiseEndpoint):
+                route = routes.setdefault(endpoint.path, Route(endpoint.path, False))
+                route.sca |= isinstance(endpoint, WiseEndpointWithSCA)
+    return list(routes.values())
+
+
+def profile(profile_id: int) -> dict[str, Any]:
+    kind = "personal" if profile_id % 2 else "business"
+    return {"id": profile_id, "type": kind, "details": {"name": f"Profile {profile_id}"}}
+
+
+def balance(profile_id: int, balance_id: int) -> dict[str, Any]:
+    currency = CURRENCIES[balance_id % len(CURRENCIES)]
+    return {
+        "id": balance_id,
+        "currency": currency,
+        "type": "STANDARD",
+        "amount": {"value": round(profile_id * 100 + balance_id * 1.5, 2), "currency": currency},
+        "reservedAmount": {"value": 0, "currency": currency},
+    }
+
+
+def statement(
+    balance_id: int, currency: str, start: str, end: str, transactions: int
+) -> dict[str, Any]:
+    interval_start, interval_end = parse_timestamp(start), parse_timestamp(end)
+    step = (interval_end - interval_start) / max(transactions, 1)
+    return {
+        "accountHolder": {"type": "PERSONAL"},
+        "issuer": {"name": "Wise Payments Limited"},
+        "bankDetails": None,
+        "transactions": [
+            {
+                "type": "DEBIT" if n % 3 else "CREDIT",
+                "date": format_timestamp(interval_end - step * (n + 1)),
+                "amount": {"value": -1.0 - n % 100 if n % 3 else 25.0, "currency": currency},
+                "totalFees": {"value": 0.0, "currency": currency},
+                "details": {"type": "CARD", "description": f"Transaction {n}"},
+                "exchangeDetails": None,
+                "runningBalance": {"value": 1000.0 - n, "currency": currency},
+                "referenceNumber": f"TRANSFER-{balance_id}-{n}",
+            }
+            for n in range(transactions)
+        ],
+        "endOfStatementBalance": {"value": 1000.0, "currency": currency},
+        "query": {"intervalStart": start, "intervalEnd": end, "currency": currency},
+    }
+
+
+class MockWiseServer:
+    """A threaded HTTP server that imitates the Wise API on ``127.0.0.1``.
+
+    ``latency`` delays every response by that many seconds.  A fraction
+    ``rate_limit_rate`` of requests are rejected with HTTP 429, and a further
+    fraction ``error_rate`` fail with one of the ``error_statuses``.  SCA
+    signatures are checked against ``sca_public_key`` when one is given;
+    otherwise any signature for an issued challenge is accepted.  Response
+    data for any path template can be replaced using ``fixtures``.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 0,
+        error_rate: float = 0.0,
+        error_statuses: tuple[int, ...] = (500, 502, 503),
+        sca_public_key: bytes | None = None,
+        statement_transactions: int = 100,
+        profiles: int = 2,
+        seed: int | None = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.host = host
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.statement_transactions = statement_transactions
+        self.profiles = profiles
+        self.routes = build_routes()
+        self.fixtures: dict[str, Fixture] = self.default_fixtures()
+        self.stats: Counter[tuple[str, int]] = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._challenges: set[str] = set()
+        self._public_key = None
+        if sca_public_key is not None:
+            from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+            self._public_key = load_pem_public_key(sca_public_key)
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.mock = self  # type: ignore[attr-defined]
+        self._thread: threading.Thread | None = None
+        # Generated bodies are reused between requests, since large
+        # statements are expensive to produce
+        self.body = lru_cache(maxsize=64)(self._body)
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self._server.server_port}"
+
+    def client(self, **kwargs: Any) -> Client:
+        """Return a client that sends its requests to this server."""
+        return Client(**{"api_key": "mock-api-key", "base_url": self.url, **kwargs})
+
+    def start(self) -> MockWiseServer:
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> MockWiseServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def default_fixtures(self) -> dict[str, Fixture]:
+        def profiles(path: dict[str, str], query: dict[str, str]) -> Any:
+            return [profile(n) for n in range(1, self.profiles + 1)]
+
+        def balances(path: dict[str, str], query: dict[str, str]) -> Any:
+            profile_id = int(path["profile_id"])
+            return [balance(profile_id, n) for n in range(len(CURRENCIES))]
+
+        def statement_fixture(path: dict[str, str], query: dict[str, str]) -> Any:
+            balance_id = int(path.get("balance_id") or path.get("account_id") or 0)
+            return statement(
+                balance_id,
+                query.get("currency", "EUR"),
+                query.get("intervalStart", "2024-01-01T00:00:00Z"),
+                query.get("intervalEnd", "2024-01-31T23:59:59.999Z"),
+                self.statement_transactions,
+            )
+
+        return {
+            "/v1/profiles": profiles,
+            "/v1/profiles/{profile_id}": lambda path, query: profile(int(path["profile_id"])),
+            "/v1/profiles/{profile_id}/account-details": lambda path, query: [
+                {"id": n, "currency": {"code": code}, "status": "ACTIVE"}
+                for n, code in enumerate(CURRENCIES)
+            ],
+            "/v4/profiles/{profile_id}/balances": balances,
+            "/v4/profiles/{profile_id}/balances/{balance_id}": lambda path, query: balance(
+                int(path["profile_id"]), int(path["balance_id"])
+            ),
+            "/v1/profiles/{profile_id}/balance-statements/{balance_id}/statement.json": (
+                statement_fixture
+            ),
+            "/v3/profiles/{profile_id}/borderless-accounts/{account_id}/statement.json": (
+                statement_fixture
+            ),
+            "/v1/borderless-accounts": lambda path, query: [
+                {"id": 1, "profileId": int(query.get("profileId", 0)), "balances": []}
+            ],
+            "/v2/borderless-accounts-configuration/profiles/{profile_id}/available-currencies": (
+                lambda path, query: [{"code": code} for code in CURRENCIES]
+            ),
+            "/v4/profiles/{profile_id}/multi-currency-account": lambda path, query: {
+                "id": 1,
+                "profileId": int(path["profile_id"]),
+                "currency": "EUR",
+            },
+            "/v3/profiles/{profile_id}/subscriptions": lambda path, query: [
+                {"id": f"subscription-{n}", "name": f"Subscription {n}"} for n in range(3)
+            ],
+            "/v3/profiles/{profile_id}/subscriptions/{subscription_id}": lambda path, query: {
+                "id": path["subscription_id"],
+                "name": "Subscription",
+            },
+            "/v1/me": lambda path, query: {"id": 1, "name": "Mock User"},
+            "/v1/users/{userId}": lambda path, query: {"id": int(path["userId"]), "name": "User"},
+        }
+
+    def _body(
+        self, template: str, path: tuple[tuple[str, str], ...], query: tuple[tuple[str, str], ...]
+    ) -> bytes:
+        fixture = self.fixtures.get(template)
+        params = dict(query)
+        data = fixture(dict(path), params) if fixture else {}
+        if isinstance(data, list) and "limit" in params:
+            offset = int(params.get("offset", 0))
+            data = data[offset : offset + int(params["limit"])]
+        return json.dumps(data).encode()
+
+    def _inject_fault(self) -> int | None:
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.rate_limit_rate:
+                return 429
+            if roll < self.rate_limit_rate + self.error_rate:
+                return self._random.choice(self.error_statuses)
+        return None
+
+    def _approved(self, headers: Any) -> bool:
+        challenge, signature = headers.get("X-2FA-Approval"), headers.get("X-Signature")
+        if not challenge or not signature or challenge not in self._challenges:
+            return False
+        if self._public_key is None:
+            return True
+
+        from base64 import b64decode
+
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        try:
+            self._public_key.verify(
+                b64decode(signature), challenge.encode(), padding.PKCS1v15(), hashes.SHA256()
+            )
+        except (InvalidSignature, ValueError):
+            return False
+        return True
+
+    def respond(self, path: str, headers: Any) -> tuple[int, dict[str, str], bytes]:
+        """Produce the status, headers and body of the response to a request."""
+        if self.latency:
+            time.sleep(self.latency)
+
+        url = urlsplit(path)
+        for route in self.routes:
+            match = route.pattern.match(url.path)
+            if match:
+                break
+        else:
+            return 404, {}, b'{"error": "not_found"}'
+
+        if not headers.get("Authorization", "").startswith("Bearer "):
+            return 401, {}, b'{"error": "unauthorized"}'
+
+        status = self._inject_fault()
+        if status == 429:
+            return 429, {"Retry-After": str(self.retry_after)}, b'{"error": "rate_limited"}'
+        if status is not None:
+            return status, {}, b'{"error": "server_error"}'
+
+        if route.sca and not self._approved(headers):
+            challenge = str(uuid.uuid4())
+            with self._lock:
+                self._challenges.add(challenge)
+            error = {"code": "forbidden", "message": "You are forbidden to send this request"}
+            return (
+                403,
+                {"X-2FA-Approval-Result": "REJECTED", "X-2FA-Approval": challenge},
+                json.dumps(error).encode(),
+            )
+
+        query = tuple(sorted(parse_qsl(url.query)))
+        body = self.body(route.template, tuple(sorted(match.groupdict().items())), query)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        if headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, {"ETag": etag}, body
+
+    def record(self, path: str, status: int) -> None:
+        url = urlsplit(path).path
+        template = next((r.template for r in self.routes if r.pattern.match(url)), url)
+        with self._lock:
+            self.stats[template, status] += 1
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send each response's headers and body together, without waiting for
+    # the client to acknowledge earlier segments
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def handle_request(self) -> None:
+        # Discard any request body, so that the connection can be reused
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        mock: MockWiseServer = self.server.mock  # type: ignore[attr-defined]
+        status, headers, body = mock.respond(self.path, self.headers)
+        mock.record(self.path, status)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+    def log_message(self, *args: Any) -> None:
+        pass
@@ -1,14 +1,12 @@
 from typing import Any
 
-from munch import munchify
-
 from pywisetransfer import Client
 from pywisetransfer.base import Base
 from pywisetransfer.endpoint import WiseEndpoint
 
 
 class UserService(Base):
-    me = WiseEndpoint(path="/v1/me")
+    me = WiseEndpoint(path="/v1/me", cache_ttl=300)
     get = WiseEndpoint(path="/v1/users/{userId}")
 
 
@@ -17,7 +15,7 @@ class User:
         self.service = UserService(client=client)
 
     def me(self) -> Any:
-        return munchify(self.service.me())
+        return self.service.convert(self.service.me(), "me")
 
     def get(self, user_id: str) -> Any:
-        return munchify(self.service.get(user_id=user_id))
+        return self.service.convert(self.service.get(user_id=user_id), "get")
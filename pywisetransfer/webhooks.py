@@ -1,10 +1,12 @@
-from base64 import b64decode
+from __future__ import annotations
 
-from cryptography.exceptions import InvalidSignature
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import padding
-from cryptography.hazmat.primitives.serialization import load_pem_public_key
+import json
+from base64 import b64decode
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from pywisetransfer.exceptions import (
     InvalidWebhookHeader,
@@ -13,8 +15,131 @@ from pywisetransfer.exceptions import (
 )
 from pywisetransfer.keys import get_webhook_public_key
 
+if TYPE_CHECKING:
+    import aiohttp.web  # type: ignore[import-not-found]
+    import starlette.requests  # type: ignore[import-not-found]
+
+
+@dataclass
+class WebhookVerificationResult:
+    valid: bool
+    error: Exception | None = None
+
+
+class WebhookVerifier:
+    """Verifies webhook signatures using public keys that are parsed once,
+    up-front, for both the live and sandbox environments.
+
+    When Wise rotates a signing key, the replacement can be installed at
+    runtime using :meth:`load_public_key`.
+    """
+
+    def __init__(self, live_key_data: bytes | None = None, sandbox_key_data: bytes | None = None):
+        # cryptography is imported when the first verifier is created, so
+        # that importing this module stays cheap for short-lived processes
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.asymmetric import padding
+
+        self._invalid_signature = InvalidSignature
+        self._padding = padding.PKCS1v15()
+        self._algorithm = hashes.SHA256()
+        self._public_keys: dict[str, Any] = {}
+        self._key_data: dict[str, bytes] = {}
+        self.load_public_key("live", live_key_data or get_webhook_public_key("live"))
+        self.load_public_key("sandbox", sandbox_key_data or get_webhook_public_key("sandbox"))
+
+    def load_public_key(self, environment: str, key_data: bytes) -> None:
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives.serialization import load_pem_public_key
+
+        public_key = load_pem_public_key(key_data, backend=default_backend())
+        self._public_keys[self._key_name(environment)] = public_key
+        self._key_data[self._key_name(environment)] = key_data
+
+    @staticmethod
+    def _key_name(environment: str) -> str:
+        return "live" if environment == "live" else "sandbox"
+
+    def verify(
+        self, payload: bytes | memoryview, signature: bytes, environment: str = "sandbox"
+    ) -> bool:
+        public_key = self._public_keys[self._key_name(environment)]
+        try:
+            public_key.verify(signature, payload, self._padding, self._algorithm)
+            return True
+        except self._invalid_signature:
+            return False
+
+    def _verify_item(
+        self, item: tuple[bytes, bytes], environment: str = "sandbox"
+    ) -> WebhookVerificationResult:
+        try:
+            payload, signature = item
+            return WebhookVerificationResult(valid=self.verify(payload, signature, environment))
+        except Exception as e:
+            return WebhookVerificationResult(valid=False, error=e)
+
+    def verify_many(
+        self,
+        items: Iterable[tuple[bytes, bytes]],
+        environment: str = "sandbox",
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> list[WebhookVerificationResult]:
+        """Verify many (payload, signature) pairs concurrently.
+
+        Results are returned in the same order as the input items; an item
+        that cannot be verified is reported using the ``error`` attribute of
+        its result, without interrupting the rest of the batch.
+        """
+        executor: Executor
+        if use_processes:
+            from concurrent.futures import ProcessPoolExecutor
+
+            executor = ProcessPoolExecutor(
+                max_workers,
+                initializer=_init_worker_verifier,
+                initargs=(environment, self._key_data[self._key_name(environment)]),
+            )
+            verify = partial(_verify_in_worker, environment=environment)
+        else:
+            executor = ThreadPoolExecutor(max_workers)
+            verify = partial(self._verify_item, environment=environment)
+
+        with executor:
+            return list(executor.map(verify, items, chunksize=64))
+
+
+_worker_verifier: WebhookVerifier | None = None
+
+
+def _init_worker_verifier(environment: str, key_data: bytes) -> None:
+    global _worker_verifier
+    _worker_verifier = WebhookVerifier()
+    _worker_verifier.load_public_key(environment, key_data)
+
+
+def _verify_in_worker(item: tuple[bytes, bytes], environment: str) -> WebhookVerificationResult:
+    assert _worker_verifier is not None
+    return _worker_verifier._verify_item(item, environment)
+
+
+_default_verifier: WebhookVerifier | None = None
+
+
+def get_default_verifier() -> WebhookVerifier:
+    global _default_verifier
+    if _default_verifier is None:
+        _default_verifier = WebhookVerifier()
+    return _default_verifier
 
-def validate_request(request: "flask.Request", environment: str = "sandbox") -> None:
+
+def validate_request(
+    request: "flask.Request",
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> None:
     if request.json is None:
         raise InvalidWebhookRequest("Webhook request does not contain JSON")
 
@@ -26,7 +151,8 @@ def validate_request(request: "flask.Request", environment: str = "sandbox") ->
     except Exception:
         raise InvalidWebhookHeader("Cannot decode webhook signature")
 
-    if not verify_signature(
+    verifier = verifier or get_default_verifier()
+    if not verifier.verify(
         payload=request.data,
         signature=signature,
         environment=environment,
@@ -35,10 +161,109 @@ def validate_request(request: "flask.Request", environment: str = "sandbox") ->
 
 
 def verify_signature(payload: bytes, signature: bytes, environment: str = "sandbox") -> bool:
-    key_data = get_webhook_public_key(environment)
-    public_key = load_pem_public_key(key_data, backend=default_backend())
+    return get_default_verifier().verify(payload, signature, environment)
+
+
+def _get_header(headers: Mapping[str, str], name: str) -> str | None:
+    # Framework header collections are case-insensitive; plain mappings are not
+    value = headers.get(name)
+    if value is None:
+        name = name.lower()
+        for key, candidate in headers.items():
+            if key.lower() == name:
+                return candidate
+    return value
+
+
+def validate_payload(
+    body: bytes | bytearray | memoryview,
+    headers: Mapping[str, str],
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> Any:
+    """Validate a raw webhook request body against its signature header, and
+    return the decoded JSON payload.
+
+    The signature is checked before any JSON decoding takes place, so that
+    forged requests are rejected at the cost of a single signature check.
+    """
+    signature_header = _get_header(headers, "X-Signature-SHA256")
+    if signature_header is None:
+        raise InvalidWebhookRequest("Webhook request does not include SHA-256 signature")
+
+    try:
+        signature = b64decode(signature_header)
+    except Exception:
+        raise InvalidWebhookHeader("Cannot decode webhook signature")
+
+    verifier = verifier or get_default_verifier()
+    if not verifier.verify(memoryview(body), signature, environment):
+        raise InvalidWebhookSignature("Invalid webhook signature")
+
     try:
-        public_key.verify(signature, payload, padding.PKCS1v15(), hashes.SHA256())
-        return True
-    except InvalidSignature:
-        return False
+        return json.loads(body if isinstance(body, (bytes, bytearray)) else body.tobytes())
+    except ValueError:
+        raise InvalidWebhookRequest("Webhook request does not contain JSON")
+
+
+def validate_wsgi_request(
+    environ: dict[str, Any],
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> Any:
+    try:
+        content_length = int(environ.get("CONTENT_LENGTH") or 0)
+    except ValueError:
+        raise InvalidWebhookRequest("Webhook request has an invalid content length")
+
+    body = environ["wsgi.input"].read(content_length) if content_length else b""
+    headers = {}
+    if "HTTP_X_SIGNATURE_SHA256" in environ:
+        headers["X-Signature-SHA256"] = environ["HTTP_X_SIGNATURE_SHA256"]
+    return validate_payload(body, headers, environment=environment, verifier=verifier)
+
+
+async def validate_asgi_request(
+    scope: dict[str, Any],
+    receive: Callable[[], Awaitable[dict[str, Any]]],
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> Any:
+    body = bytearray()
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+    headers = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+    return validate_payload(body, headers, environment=environment, verifier=verifier)
+
+
+async def validate_starlette_request(
+    request: "starlette.requests.Request",
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> Any:
+    body = await request.body()
+    return validate_payload(body, request.headers, environment=environment, verifier=verifier)
+
+
+async def validate_aiohttp_request(
+    request: "aiohttp.web.Request",
+    environment: str = "sandbox",
+    verifier: WebhookVerifier | None = None,
+) -> Any:
+    body = await request.read()
+    return validate_payload(body, request.headers, environment=environment, verifier=verifier)
+
+
+def verify_signatures(
+    items: Iterable[tuple[bytes, bytes]],
+    environment: str = "sandbox",
+    max_workers: int | None = None,
+    use_processes: bool = False,
+) -> list[WebhookVerificationResult]:
+    return get_default_verifier().verify_many(
+        items, environment=environment, max_workers=max_workers, use_processes=use_processes
+    )
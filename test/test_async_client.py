@@ -0,0 +1,188 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pywisetransfer.async_client import AsyncClient
+from pywisetransfer.exceptions import WiseAccessDeniedException
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_profile_list():
+    def handler(request):
+        assert request.url == "https://api.sandbox.transferwise.tech/v1/profiles"
+        assert request.headers["Authorization"] == "Bearer test-key"
+        return httpx.Response(200, json=[{"id": 0, "type": "personal"}])
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.profiles.list()
+
+    profiles = _run(main())
+    assert profiles[0].type == "personal"
+
+
+def test_async_access_denied():
+    def handler(request):
+        return httpx.Response(403, json={"code": "access.denied", "message": "No message"})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.account_details.list(profile_id=0)
+
+    with pytest.raises(WiseAccessDeniedException):
+        _run(main())
+
+
+def test_async_sca_statement():
+    challenge = "7fa8c832-b8b5-4757-9c24-e952119999f2"
+
+    def handler(request):
+        assert request.url.params["currency"] == "GBP"
+        if request.headers.get("X-2FA-Approval") != challenge:
+            return httpx.Response(
+                403,
+                json={"status": 403, "error": "Forbidden"},
+                headers={"X-2FA-Approval-Result": "REJECTED", "X-2FA-Approval": challenge},
+            )
+        assert request.headers["X-Signature"].startswith("H4AmLxMBsJ08oF80")
+        return httpx.Response(200, json={"endOfStatementBalance": {"value": 9.94}})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key",
+            private_key_file="test/test-sca.pem",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            return await client.balance_statements.statement(
+                profile_id=0,
+                balance_id=231,
+                params={
+                    "currency": "GBP",
+                    "intervalStart": "2018-03-01T00:00:00Z",
+                    "intervalEnd": "2018-04-30T23:59:59.999Z",
+                },
+            )
+
+    statement = _run(main())
+    assert statement.endOfStatementBalance.value == 9.94
+
+
+def test_async_client_is_not_a_client():
+    from pywisetransfer import Client
+
+    client = AsyncClient(api_key="test-key")
+    assert not isinstance(client, Client)
+    for name in ("borderless_accounts", "record", "replay", "session"):
+        assert not hasattr(client, name)
+
+
+def test_async_unknown_keyword_argument():
+    async def main():
+        async with AsyncClient(api_key="test-key") as client:
+            await client.profiles.list(type="personal")
+
+    with pytest.raises(TypeError, match="type"):
+        _run(main())
+
+
+def test_async_sca_only_for_sca_endpoints():
+    challenge = "7fa8c832-b8b5-4757-9c24-e952119999f2"
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("X-2FA-Approval"))
+        return httpx.Response(
+            403,
+            json={"code": "access.denied", "message": "No message"},
+            headers={"X-2FA-Approval-Result": "REJECTED", "X-2FA-Approval": challenge},
+        )
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key",
+            private_key_file="test/test-sca.pem",
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            client.sca.sign(challenge, lambda c: "signature")
+            await client.profiles.get(profile_id=0)
+
+    with pytest.raises(WiseAccessDeniedException):
+        _run(main())
+    assert seen == [None]
+
+
+def test_async_cache_and_revalidation():
+    from pywisetransfer.cache import MemoryCache
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.url.path == "/v1/profiles":
+            return httpx.Response(200, json=[{"id": 0, "type": "personal"}])
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=[{"id": 1}], headers={"ETag": '"v1"'})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key", cache=MemoryCache(), transport=httpx.MockTransport(handler)
+        ) as client:
+            await client.profiles.list()
+            await client.profiles.list()
+            first = await client.balances.list(profile_id=0, params={"types": "STANDARD"})
+            second = await client.balances.list(profile_id=0, params={"types": "STANDARD"})
+            return first, second
+
+    first, second = _run(main())
+    assert [r.url.path for r in requests] == ["/v1/profiles"] + ["/v4/profiles/0/balances"] * 2
+    assert first == second == [{"id": 1}]
+
+
+def test_async_coalesce_requests():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": 101})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key", coalesce_requests=True, transport=httpx.MockTransport(handler)
+        ) as client:
+            results = await asyncio.gather(*(client.users.me() for _ in range(5)))
+            return client.single_flight, results
+
+    single_flight, results = _run(main())
+    assert len(calls) == 1
+    assert [r.id for r in results] == [101] * 5
+    assert (single_flight.executed, single_flight.coalesced) == (1, 4)
+
+
+def test_async_bulk_balances():
+    def handler(request):
+        assert request.url.params["types"] == "STANDARD"
+        profile_id = int(request.url.path.split("/")[3])
+        if profile_id == 3:
+            return httpx.Response(403, json={"code": "forbidden", "message": "Access denied"})
+        return httpx.Response(200, json=[{"id": profile_id * 10}])
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key", transport=httpx.MockTransport(handler)
+        ) as client:
+            return await client.bulk_balances([1, 2, 3, 1], max_concurrency=2)
+
+    results = _run(main())
+    assert list(results) == [1, 2, 3]
+    assert results[2].value[0].id == 20
+    assert isinstance(results[3].error, WiseAccessDeniedException)
@@ -0,0 +1,86 @@
+import json
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.balance_statements import split_interval
+
+
+@pytest.fixture
+def sca_challenge():
+    return "7fa8c832-b8b5-4757-9c24-e952119999f2"
+
+
+def _transaction(reference, date):
+    return {"type": "DEBIT", "date": date, "referenceNumber": reference, "amount": {"value": -1}}
+
+
+@pytest.fixture
+def statements(sca_challenge):
+    requested = []
+
+    def callback(request):
+        if request.headers.get("X-2FA-Approval") != sca_challenge:
+            requested.append(None)
+            headers = {"X-2FA-Approval-Result": "REJECTED", "X-2FA-Approval": sca_challenge}
+            return 403, headers, json.dumps({"status": 403})
+
+        start = request.params["intervalStart"]
+        requested.append((start, request.params["intervalEnd"]))
+        transactions = [
+            _transaction("CARD-1", "2024-01-15T10:00:00Z"),
+            _transaction("CARD-2", "2024-02-20T10:00:00Z"),
+            _transaction("CARD-3", "2024-03-05T10:00:00Z"),
+        ]
+        window = [t for t in transactions if start[:7] <= t["date"][:7]]
+        return 200, {}, json.dumps({"transactions": window[:2]})
+
+    with responses.RequestsMock() as mock:
+        mock.add_callback(
+            responses.GET,
+            re.compile(
+                r"https://api.sandbox.transferwise.tech/v1/profiles/0/balance-statements/1/.*"
+            ),
+            callback=callback,
+        )
+        yield requested
+
+
+def test_split_interval():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2024, 3, 31, tzinfo=timezone.utc)
+    windows = split_interval(start, end, timedelta(days=31))
+
+    assert windows[0][0] == start
+    assert windows[-1][1] == end
+    assert len(windows) == 3
+    for (_, previous_end), (next_start, _) in zip(windows, windows[1:]):
+        assert next_start - previous_end == timedelta(milliseconds=1)
+
+
+def test_transactions_across_windows(statements):
+    client = Client(api_key="test-key", private_key_file="test/test-sca.pem")
+    transactions = client.balance_statements.transactions(
+        profile_id=0,
+        balance_id=1,
+        currency="EUR",
+        interval_start="2024-01-01T00:00:00Z",
+        interval_end="2024-03-31T23:59:59.999Z",
+        max_interval=timedelta(days=31),
+    )
+
+    assert [t.referenceNumber for t in transactions] == ["CARD-3", "CARD-2", "CARD-1"]
+    assert statements.count(None) == 1
+    assert sorted(statements[1:])[0] == ("2024-01-01T00:00:00.000Z", "2024-01-31T23:59:59.999Z")
+    assert len(statements) == 4
+
+
+def test_iter_transactions_validates_type_on_call():
+    client = Client(api_key="test-key")
+    with pytest.raises(ValueError):
+        client.balance_statements.iter_transactions(
+            0, 231, "GBP", "2018-03-01T00:00:00Z", "2018-04-30T23:59:59.999Z", type="BAD"
+        )
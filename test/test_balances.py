@@ -0,0 +1,63 @@
+import json
+
+import pytest
+import responses
+
+from pywisetransfer import Client
+
+
+@pytest.fixture
+def balance_url():
+    return "https://api.sandbox.transferwise.tech/v4/profiles/0/balances/1"
+
+
+@pytest.fixture
+def balance_response():
+    return {"id": 1, "currency": "EUR", "amount": {"value": 9.94, "currency": "EUR"}}
+
+
+@pytest.fixture
+def conditional_balance(balance_url, balance_response):
+    def callback(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {"ETag": '"v1"'}, ""
+        return 200, {"ETag": '"v1"'}, json.dumps(balance_response)
+
+    with responses.RequestsMock() as mock:
+        mock.add_callback(responses.GET, balance_url, callback=callback)
+        yield mock
+
+
+def test_balance_revalidated(conditional_balance):
+    client = Client(api_key="test-key")
+    first = client.balances.get(profile_id=0, balance_id=1)
+    second = client.balances.get(profile_id=0, balance_id=1)
+
+    assert first == second
+    assert second.amount.value == 9.94
+    assert [call.response.status_code for call in conditional_balance.calls] == [200, 304]
+
+
+@responses.activate
+def test_balance_last_modified(balance_url, balance_response):
+    last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+    responses.add(
+        responses.GET, balance_url, json=balance_response, headers={"Last-Modified": last_modified}
+    )
+
+    client = Client(api_key="test-key")
+    client.balances.get(profile_id=0, balance_id=1)
+    client.balances.get(profile_id=0, balance_id=1)
+
+    assert responses.calls[1].request.headers["If-Modified-Since"] == last_modified
+
+
+@responses.activate
+def test_balance_without_validators(balance_url, balance_response):
+    responses.add(responses.GET, balance_url, json=balance_response)
+
+    client = Client(api_key="test-key")
+    client.balances.get(profile_id=0, balance_id=1)
+    client.balances.get(profile_id=0, balance_id=1)
+
+    assert "If-None-Match" not in responses.calls[1].request.headers
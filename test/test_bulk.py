@@ -0,0 +1,38 @@
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.bulk import fan_out
+from pywisetransfer.exceptions import WiseAccessDeniedException
+
+
+def test_fan_out_reports_errors_per_profile():
+    def fn(profile_id):
+        if profile_id == 2:
+            raise ValueError("unknown profile")
+        return profile_id * 10
+
+    results = fan_out(fn, [3, 1, 2, 1], max_workers=2)
+
+    assert list(results) == [3, 1, 2]
+    assert results[3].value == 30 and results[3].ok
+    assert isinstance(results[2].error, ValueError) and not results[2].ok
+
+
+def test_fan_out_without_profiles():
+    assert fan_out(lambda profile_id: None, []) == {}
+
+
+@responses.activate
+def test_bulk_balances():
+    url = "https://api.sandbox.transferwise.tech/v4/profiles/{}/balances?types=STANDARD"
+    responses.get(url.format(1), json=[{"id": 10, "currency": "EUR"}])
+    responses.get(url.format(2), json=[{"id": 20, "currency": "GBP"}])
+    responses.get(url.format(3), status=403, json={"code": "forbidden", "message": "Access denied"})
+
+    client = Client(api_key="test-key")
+    results = client.bulk_balances([1, 2, 3])
+
+    assert results[1].value[0].currency == "EUR"
+    assert results[2].value[0].id == 20
+    assert isinstance(results[3].error, WiseAccessDeniedException)
@@ -0,0 +1,84 @@
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.cache import MISSING, MemoryCache, SqliteCache
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(maxsize=2)
+    return SqliteCache(str(tmp_path / "responses.db"), maxsize=2)
+
+
+def test_cache_roundtrip(cache):
+    cache.set("client:/v1/me?", {"id": 101}, ttl=60)
+    assert cache.get("client:/v1/me?") == {"id": 101}
+    assert cache.get("client:/v1/profiles?") is MISSING
+
+
+def test_cache_expiry(cache):
+    cache.set("client:/v1/me?", {"id": 101}, ttl=0)
+    assert cache.get("client:/v1/me?") is MISSING
+
+
+def test_cache_lru_eviction(cache):
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_invalidate_prefix(cache):
+    cache.set("client:/v1/profiles?", [], ttl=60)
+    cache.set("client:/v1/me?", {}, ttl=60)
+    cache.invalidate("client:/v1/profiles")
+    assert cache.get("client:/v1/profiles?") is MISSING
+    assert cache.get("client:/v1/me?") == {}
+
+
+@pytest.fixture
+def profiles_url():
+    return "https://api.sandbox.transferwise.tech/v1/profiles"
+
+
+@responses.activate
+def test_client_cache(profiles_url):
+    responses.add(responses.GET, profiles_url, json=[{"id": 0, "type": "personal"}])
+    client = Client(api_key="test-key", cache=MemoryCache())
+
+    assert client.profiles.list()[0].id == 0
+    assert client.profiles.list()[0].id == 0
+    assert len(responses.calls) == 1
+
+    client.invalidate_cache("/v1/profiles")
+    client.profiles.list()
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_client_cache_keyed_by_client(profiles_url):
+    responses.add(responses.GET, profiles_url, json=[])
+    cache = MemoryCache()
+
+    Client(api_key="first-key", cache=cache).profiles.list()
+    Client(api_key="second-key", cache=cache).profiles.list()
+    Client(api_key="first-key", cache=cache).profiles.list()
+
+    keys = [call.request.headers["Authorization"] for call in responses.calls]
+    assert keys == ["Bearer first-key", "Bearer second-key"]
+
+
+@responses.activate
+def test_client_cache_uncached_endpoint():
+    url = "https://api.sandbox.transferwise.tech/v4/profiles/0/balances/1"
+    responses.add(responses.GET, url, json={"id": 1})
+    client = Client(api_key="test-key", cache=MemoryCache())
+
+    client.balances.get(profile_id=0, balance_id=1)
+    client.balances.get(profile_id=0, balance_id=1)
+    assert len(responses.calls) == 2
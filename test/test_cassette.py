@@ -0,0 +1,47 @@
+import gzip
+import os
+
+import pytest
+
+from pywisetransfer import Client
+from pywisetransfer.exceptions import UnrecordedRequest
+from pywisetransfer.testing import MockWiseServer
+
+PRIVATE_KEY_FILE = os.path.join(os.path.dirname(__file__), "test-sca.pem")
+START, END = "2024-01-01T00:00:00Z", "2024-01-31T23:59:59.999Z"
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    path = str(tmp_path / "wise.cassette")
+    with MockWiseServer(statement_transactions=50) as server:
+        client = server.client(private_key_file=PRIVATE_KEY_FILE)
+        with client.record(path):
+            client.profiles.list()
+            client.balance_statements.statement(1, 2, "EUR", START, END)
+    return path, server.url
+
+
+def test_cassette_omits_credentials(cassette_path):
+    path, _ = cassette_path
+    with gzip.open(path, "rt") as f:
+        contents = f.read()
+    assert "mock-api-key" not in contents
+    assert "X-2FA-Approval" in contents
+
+
+def test_replay(cassette_path):
+    # The server has stopped, so responses can only come from the cassette
+    path, url = cassette_path
+    client = Client(api_key="mock-api-key", base_url=url, private_key_file=PRIVATE_KEY_FILE)
+    with client.replay(path):
+        for _ in range(3):
+            assert [profile.id for profile in client.profiles.list()] == [1, 2]
+            statement = client.balance_statements.statement(1, 2, "EUR", START, END)
+            assert len(statement.transactions) == 50
+
+        transactions = client.balance_statements.iter_transactions(1, 2, "EUR", START, END)
+        assert sum(1 for _ in transactions) == 50
+
+        with pytest.raises(UnrecordedRequest):
+            client.profiles.get(profile_id=1)
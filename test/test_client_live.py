@@ -43,3 +43,41 @@ def test_client_live_environment(me_response):
     domain = client.borderless_accounts.service.domain
     assert "api.sandbox.transferwise" not in domain
     assert "api.transferwise" in domain
+
+
+@responses.activate
+def test_clients_are_independent(me_response):
+    responses.add(responses.GET, "https://api.transferwise.com/v1/me", json=me_response)
+    responses.add(responses.GET, "https://api.sandbox.transferwise.tech/v1/me", json=me_response)
+    import pywisetransfer
+
+    live = pywisetransfer.Client(api_key="live-key", environment="live")
+    sandbox = pywisetransfer.Client(api_key="sandbox-key", environment="sandbox")
+    live.users.me()
+    sandbox.users.me()
+    live.users.me()
+
+    requests = [
+        (call.request.url, call.request.headers["Authorization"]) for call in responses.calls
+    ]
+    assert requests == [
+        ("https://api.transferwise.com/v1/me", "Bearer live-key"),
+        ("https://api.sandbox.transferwise.tech/v1/me", "Bearer sandbox-key"),
+        ("https://api.transferwise.com/v1/me", "Bearer live-key"),
+    ]
+
+
+@responses.activate
+def test_clients_in_threads(me_response):
+    from collections import Counter
+    from concurrent.futures import ThreadPoolExecutor
+
+    responses.add(responses.GET, "https://api.sandbox.transferwise.tech/v1/me", json=me_response)
+    import pywisetransfer
+
+    clients = [pywisetransfer.Client(api_key=f"key-{n}") for n in range(8)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda client: client.users.me(), clients * 4))
+
+    keys = Counter(call.request.headers["Authorization"] for call in responses.calls)
+    assert keys == {f"Bearer key-{n}": 4 for n in range(8)}
@@ -14,6 +14,11 @@ def test_client_invalid_environment():
         pywisetransfer.Client(api_key="test-key", environment="test-environment")
 
 
+def test_client_invalid_response_mode():
+    with pytest.raises(WiseClientConfigurationException, match="pywisetransfer.response_mode"):
+        pywisetransfer.Client(api_key="test-key", response_mode="xml")
+
+
 def test_client_default_environment():
     client = pywisetransfer.Client(api_key="test-key")
 
@@ -1,4 +1,4 @@
-from warnings import catch_warnings
+from warnings import catch_warnings, simplefilter
 
 import pytest
 
@@ -73,3 +73,21 @@ def test_decorator_variants(func, name, deprecated, result, message):
 def test_standalone_decorator_repr():
     decorator = deprecated(message="standalone")
     assert repr(decorator) == "<deprecation decorator ('standalone')>"
+
+
+def test_warns_once_per_call_site():
+    with record_warnings() as ws:
+        for n in range(3):
+            posarg_decorator(n)
+        posarg_decorator(0)
+
+    assert len(ws) == 2
+    assert all(w.filename == __file__ for w in ws)
+
+
+def test_error_filter_applies_to_every_call():
+    with record_warnings():
+        simplefilter("error")
+        for _ in range(2):
+            with pytest.raises(DeprecationWarning):
+                kwarg_decorator(0)
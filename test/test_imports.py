@@ -0,0 +1,53 @@
+import subprocess
+import sys
+
+import pytest
+
+from pywisetransfer import Client
+from pywisetransfer.profile import Profile
+
+
+def imported_modules(code):
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}; import sys; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import pywisetransfer; pywisetransfer.Client(api_key='key')",
+        "import pywisetransfer.webhooks",
+    ],
+)
+def test_heavy_imports_are_deferred(code):
+    modules = imported_modules(code)
+    for name in ("apiron", "cryptography", "munch", "requests", "sqlite3"):
+        assert name not in modules
+
+
+def test_resources_are_built_on_first_access():
+    client = Client(api_key="test-key")
+    assert "profiles" not in vars(client)
+
+    profiles = client.profiles
+    assert isinstance(profiles, Profile)
+    assert client.profiles is profiles
+
+
+def test_add_resources_is_deprecated():
+    client = Client(api_key="test-key")
+    with pytest.deprecated_call():
+        client.add_resources()
+    assert isinstance(vars(client)["profiles"], Profile)
+
+
+def test_base_client_is_abstract():
+    from pywisetransfer import BaseClient
+
+    with pytest.raises(TypeError):
+        BaseClient(api_key="test-key", coalesce_requests=True)
@@ -0,0 +1,149 @@
+import os
+
+import pytest
+import responses
+from requests.exceptions import HTTPError
+
+from pywisetransfer import Client
+from pywisetransfer.base import Base
+from pywisetransfer.endpoint import WiseEndpointWithSCA
+
+PROFILE_URL = "https://api.sandbox.transferwise.tech/v1/profiles/0"
+
+
+@pytest.fixture
+def timings():
+    return []
+
+
+@pytest.fixture
+def client(timings):
+    client = Client(api_key="test-key")
+    client.add_listener(timings.append)
+    return client
+
+
+@responses.activate
+def test_call_phases_are_timed(client, timings):
+    responses.get(PROFILE_URL, json={"id": 0, "type": "personal"})
+
+    client.profiles.get(profile_id=0)
+
+    assert [t.phase for t in timings] == ["request", "decode", "convert"]
+    assert {t.endpoint for t in timings} == {"/v1/profiles/{profile_id}"}
+    assert {t.method for t in timings} == {"GET"}
+    request = timings[0]
+    assert request.status == 200
+    assert request.size == len(b'{"id": 0, "type": "personal"}')
+    assert request.duration >= 0 and request.elapsed is not None
+
+
+@responses.activate
+def test_failed_calls_are_timed(client, timings):
+    responses.get(PROFILE_URL, status=404, json={})
+
+    with pytest.raises(HTTPError):
+        client.profiles.get(profile_id=0)
+
+    assert len(timings) == 1
+    assert timings[0].status == 404
+    assert isinstance(timings[0].error, HTTPError)
+
+
+@responses.activate
+def test_listener_errors_do_not_affect_calls(client, timings):
+    responses.get(PROFILE_URL, json={"id": 0})
+
+    def broken(timing):
+        raise RuntimeError("listener failed")
+
+    client.listeners.insert(0, broken)
+    assert client.profiles.get(profile_id=0).id == 0
+    assert len(timings) == 3
+
+
+@responses.activate
+def test_no_timing_without_listeners(monkeypatch):
+    def unexpected(*args, **kwargs):
+        raise AssertionError("calls should not be timed")
+
+    monkeypatch.setattr("pywisetransfer.endpoint.Timer", unexpected)
+    monkeypatch.setattr("pywisetransfer.instrumentation.Timer", unexpected)
+    responses.get(PROFILE_URL, json={"id": 0})
+
+    assert Client(api_key="test-key").profiles.get(profile_id=0).id == 0
+
+
+class ScaService(Base):
+    approve = WiseEndpointWithSCA(path="/v1/approvals")
+
+
+@responses.activate
+def test_sca_signing_is_timed(timings):
+    url = "https://api.sandbox.transferwise.tech/v1/approvals"
+    challenge = "7fa8c832-b8b5-4757-9c24-e952119999f2"
+    responses.get(
+        url,
+        status=403,
+        headers={"X-2FA-Approval-Result": "REJECTED", "X-2FA-Approval": challenge},
+        json={},
+    )
+    responses.get(url, json={"approved": True})
+
+    client = Client(
+        api_key="test-key",
+        private_key_file=os.path.join(os.path.dirname(__file__), "test-sca.pem"),
+    )
+    client.add_listener(timings.append)
+    assert ScaService(client=client).approve()["approved"]
+
+    assert [(t.phase, t.status) for t in timings] == [
+        ("request", 403),
+        ("sca_sign", 403),
+        ("request", 200),
+        ("decode", 200),
+    ]
+
+
+@responses.activate
+def test_prometheus_listener(client):
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from pywisetransfer.instrumentation import PrometheusListener
+
+    registry = prometheus_client.CollectorRegistry()
+    client.add_listener(PrometheusListener(registry=registry))
+    responses.get(PROFILE_URL, json={"id": 0})
+    client.profiles.get(profile_id=0)
+
+    labels = {
+        "endpoint": "/v1/profiles/{profile_id}",
+        "method": "GET",
+        "status": "200",
+        "phase": "request",
+    }
+    assert registry.get_sample_value("pywisetransfer_call_duration_seconds_count", labels) == 1
+
+
+@responses.activate
+def test_convert_is_labelled_by_its_endpoint():
+    from pywisetransfer.cache import MemoryCache
+
+    responses.get("https://api.sandbox.transferwise.tech/v1/profiles", json=[{"id": 0}])
+    responses.get("https://api.sandbox.transferwise.tech/v4/profiles/0/balances/1", json={"id": 1})
+    timings = []
+    client = Client(api_key="test-key", cache=MemoryCache())
+    client.profiles.list()
+    client.add_listener(timings.append)
+
+    # The cached profiles response is converted after a balances call
+    client.balances.get(profile_id=0, balance_id=1)
+    client.profiles.list()
+    # Pages are fetched in a background thread
+    list(client.profiles.iter_profiles())
+
+    converts = [t.endpoint for t in timings if t.phase == "convert"]
+    assert converts == [
+        "/v4/profiles/{profile_id}/balances/{balance_id}",
+        "/v1/profiles",
+        "/v1/profiles",
+    ]
@@ -0,0 +1,38 @@
+import json
+
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.exceptions import WiseClientConfigurationException
+from pywisetransfer.json_backends import get_json_loads
+
+
+def test_json_backend_default():
+    assert get_json_loads() is json.loads
+
+
+def test_json_backend_auto():
+    loads = get_json_loads("auto")
+    assert loads(b'{"value": [1, 2]}') == {"value": [1, 2]}
+
+
+def test_json_backend_unknown():
+    with pytest.raises(WiseClientConfigurationException, match="pywisetransfer.json_backend"):
+        get_json_loads("yaml")
+
+
+@responses.activate
+def test_client_orjson_backend():
+    orjson = pytest.importorskip("orjson")
+    responses.add(
+        responses.GET,
+        "https://api.sandbox.transferwise.tech/v4/profiles/0/balances/1",
+        json={"id": 1, "amount": {"value": 9.94, "currency": "EUR"}},
+    )
+
+    client = Client(api_key="test-key", json_backend="orjson")
+    balance = client.balances.get(profile_id=0, balance_id=1)
+
+    assert client.json_loads is orjson.loads
+    assert balance.amount.value == 9.94
@@ -0,0 +1,107 @@
+import pytest
+
+from pywisetransfer.models import LazyList, LazyMunch, Record, lazify, structify
+
+
+@pytest.fixture
+def balance():
+    return {
+        "id": 200001,
+        "currency": "EUR",
+        "amount": {"value": 9.94, "currency": "EUR"},
+        "reservedAmount": {"value": 0, "currency": "EUR"},
+        "investmentState": "NOT_INVESTED",
+        "headers": {"X-Custom": "value"},
+        "tags": [{"class": "keyword"}, {"name": "plain"}],
+    }
+
+
+def test_structify_attributes(balance):
+    record = structify(balance)
+
+    assert isinstance(record, Record)
+    assert record.amount.value == 9.94
+    assert record["currency"] == "EUR"
+    assert "investmentState" in record
+    assert record.get("missing") is None
+    assert not hasattr(record, "__dict__")
+
+
+def test_structify_shares_types(balance):
+    record = structify(balance)
+    assert type(record.amount) is type(record.reservedAmount)
+
+
+def test_structify_unsuitable_keys(balance):
+    record = structify(balance)
+    assert record.headers == {"X-Custom": "value"}
+    assert record.tags[0] == {"class": "keyword"}
+    assert record.tags[1].name == "plain"
+
+
+def test_structify_to_dict(balance):
+    assert structify(balance).to_dict() == balance
+
+
+def test_lazify_wraps_on_access(balance):
+    record = lazify(balance)
+
+    assert isinstance(record, LazyMunch)
+    assert type(dict.__getitem__(record, "amount")) is dict
+    assert record.amount.value == 9.94
+    assert isinstance(dict.__getitem__(record, "amount"), LazyMunch)
+    assert record.amount is record["amount"]
+
+
+def test_lazify_lists(balance):
+    records = lazify([balance, balance])
+
+    assert isinstance(records, LazyList)
+    assert [record.currency for record in records] == ["EUR", "EUR"]
+    assert records[0].tags[1].name == "plain"
+    assert isinstance(records[1:], LazyList)
+
+
+def test_lazify_munch_compatibility(balance):
+    record = lazify(balance)
+    record.note = "added"
+
+    assert record["note"] == "added"
+    assert record.get("missing", 1) == 1
+    assert all(isinstance(value, LazyMunch) for key, value in record.items() if "mount" in key)
+    with pytest.raises(AttributeError):
+        record.missing
+    assert record.toDict() == {**balance, "note": "added"}
+
+
+def test_structify_bounds_record_types():
+    from pywisetransfer.models import MAX_RECORD_FIELDS, _record_type
+
+    for n in range(1000):
+        structify({f"field{n}": n})
+    assert _record_type.cache_info().currsize <= _record_type.cache_info().maxsize
+
+    wide = {f"C{n}": n for n in range(MAX_RECORD_FIELDS + 1)}
+    assert structify(wide) == wide
+
+
+def test_lazify_views_and_copy(balance):
+    record = lazify(balance)
+    values, items = record.values(), record.items()
+
+    assert len(values) == len(items) == len(balance)
+    assert list(values) == list(values)
+    assert isinstance(dict(items)["amount"], LazyMunch)
+    assert ("currency", "EUR") in items
+
+    copied = record.copy()
+    assert isinstance(copied, LazyMunch)
+    assert copied.amount.value == 9.94
+    copied.amount.value = 0
+    assert record.amount.value == 9.94
+
+
+@pytest.mark.parametrize("data", [{"get": 1, "id": 2}, {"id": 2, "get": 1}, {"to_dict": 3}])
+def test_structify_keys_named_like_record_methods(data):
+    assert structify(data) == data
+    assert type(structify(data)) is dict
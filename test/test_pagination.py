@@ -0,0 +1,94 @@
+import threading
+
+import pytest
+import responses
+from responses import matchers
+
+from pywisetransfer import Client
+from pywisetransfer.pagination import (
+    CursorPaging,
+    NextPageUrlPaging,
+    OffsetPaging,
+    iter_items,
+    iter_pages,
+)
+
+
+def offset_pages(total):
+    def fetch(params):
+        start = params["offset"]
+        return list(range(start, min(start + params["limit"], total)))
+
+    return fetch
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+@pytest.mark.parametrize("total", [0, 5, 9, 10])
+def test_offset_paging(total, prefetch):
+    items = iter_items(offset_pages(total), OffsetPaging(limit=5), list, prefetch=prefetch)
+    assert list(items) == list(range(total))
+
+
+def test_offset_paging_ignored_by_server():
+    pages = list(iter_pages(lambda params: [1, 2], OffsetPaging(limit=2)))
+    assert pages == [[1, 2]]
+
+
+def test_cursor_paging():
+    pages = {
+        None: {"cursor": "b", "activities": [1, 2]},
+        "b": {"cursor": "c", "activities": [3]},
+        "c": {"cursor": None, "activities": []},
+    }
+    items = iter_items(
+        lambda params: pages[params.get("nextCursor")],
+        CursorPaging(items_key="activities", size=2),
+        list,
+    )
+    assert list(items) == [1, 2, 3]
+
+
+def test_next_page_url_paging():
+    pages = {
+        "1": {"items": [1, 2], "nextPageUrl": "https://example.test/items?page=2"},
+        "2": {"items": [3], "nextPageUrl": None},
+    }
+    items = iter_items(
+        lambda params: pages[params.get("page", "1")], NextPageUrlPaging(items_key="items"), list
+    )
+    assert list(items) == [1, 2, 3]
+
+
+def test_next_page_is_prefetched():
+    requested = []
+    second_page_requested = threading.Event()
+
+    def fetch(params):
+        requested.append(params["offset"])
+        if params["offset"] == 2:
+            second_page_requested.set()
+        return [params["offset"], params["offset"] + 1] if params["offset"] < 4 else []
+
+    items = iter_items(fetch, OffsetPaging(limit=2), list)
+    assert next(items) == 0
+    assert second_page_requested.wait(timeout=5)
+    assert list(items) == [1, 2, 3]
+    assert requested == [0, 2, 4]
+
+
+@responses.activate
+def test_iter_profiles():
+    url = "https://api.sandbox.transferwise.tech/v1/profiles"
+    for offset, profiles in [
+        (0, [{"id": 0, "type": "personal"}, {"id": 1, "type": "business"}]),
+        (2, [{"id": 2, "type": "personal"}]),
+    ]:
+        responses.get(
+            url,
+            json=profiles,
+            match=[matchers.query_param_matcher({"offset": str(offset), "limit": "2"})],
+        )
+
+    client = Client(api_key="test-key")
+    profiles = client.profiles.iter_profiles(type="personal", page_size=2)
+    assert [profile.id for profile in profiles] == [0, 2]
@@ -70,3 +70,18 @@ def test_profile_list_type_filtered(profile_list_response):
     results = list(endpoint.list(type="business"))
 
     assert len(results) == 1
+
+
+@pytest.mark.parametrize("response_mode", ["lazy", "struct"])
+@responses.activate
+def test_profile_list_response_modes(profile_list_response, response_mode):
+    responses.add(
+        responses.GET,
+        "https://api.sandbox.transferwise.tech/v1/profiles",
+        json=profile_list_response,
+    )
+
+    endpoint = Client(api_key="test-key", response_mode=response_mode).profiles
+    results = endpoint.list(type="business")
+
+    assert [profile.details.name for profile in results] == ["ABC Logistics Ltd"]
@@ -0,0 +1,123 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+import responses
+from requests.exceptions import HTTPError
+
+from pywisetransfer import Client
+from pywisetransfer.async_client import AsyncClient
+from pywisetransfer.ratelimit import (
+    RateLimit,
+    TokenBucket,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_burst_then_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    delays = [bucket.reserve() for _ in range(5)]
+    assert delays == [0, 0, 0, 0.5, 1.0]
+
+
+def test_token_bucket_pause():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=1, clock=clock)
+    bucket.pause(2)
+    assert bucket.reserve() == pytest.approx(2)
+
+
+def test_token_bucket_adapts_rate():
+    bucket = TokenBucket(rate=10, clock=FakeClock())
+    bucket.throttle(retry_after=0)
+    assert bucket.rate == 5
+    bucket.update({})
+    assert bucket.rate == 5.5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 -0000") == 0
+    # Dates with a "-0000" offset are parsed as naive datetimes, in UTC
+    in_an_hour = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    assert 3590 < parse_retry_after(format_datetime(in_an_hour)) <= 3600
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_parse_rate_limit_reset():
+    assert parse_rate_limit_reset({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}) == 2
+    assert parse_rate_limit_reset({"RateLimit-Remaining": "5", "RateLimit-Reset": "2"}) is None
+    assert parse_rate_limit_reset({}) is None
+
+
+@pytest.fixture
+def rate_limited_profile():
+    statuses = [429, 429, 200]
+
+    def callback(request):
+        status = statuses.pop(0)
+        body = {"id": 0, "type": "personal"} if status == 200 else {"error": "Too Many Requests"}
+        return status, {"Retry-After": "0"}, json.dumps(body)
+
+    return callback
+
+
+def test_client_retries_rate_limited_requests(rate_limited_profile):
+    client = Client(api_key="test-key", rate_limits={"default": RateLimit(rate=100, burst=5)})
+    with responses.RequestsMock() as mock:
+        mock.add_callback(
+            responses.GET,
+            "https://api.sandbox.transferwise.tech/v1/profiles/0",
+            callback=rate_limited_profile,
+        )
+        profile = client.profiles.get(profile_id=0)
+        assert len(mock.calls) == 3
+
+    assert profile.type == "personal"
+    assert client.rate_limiter.bucket("default").rate < 100
+
+
+def test_client_without_rate_limits_raises(rate_limited_profile):
+    client = Client(api_key="test-key")
+    with responses.RequestsMock() as mock:
+        mock.add_callback(
+            responses.GET,
+            "https://api.sandbox.transferwise.tech/v1/profiles/0",
+            callback=rate_limited_profile,
+        )
+        with pytest.raises(HTTPError):
+            client.profiles.get(profile_id=0)
+
+
+def test_async_client_retries_rate_limited_requests():
+    statuses = [429, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"id": 0}, headers={"Retry-After": "0"})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key",
+            transport=httpx.MockTransport(handler),
+            rate_limits={"default": RateLimit(rate=100)},
+        ) as client:
+            return await client.profiles.get(profile_id=0)
+
+    assert asyncio.run(main()).id == 0
+    assert statuses == []
@@ -0,0 +1,150 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+import responses
+from requests.exceptions import ConnectionError, ConnectTimeout, HTTPError
+
+from pywisetransfer import Client
+from pywisetransfer.async_client import AsyncClient
+from pywisetransfer.ratelimit import RateLimit
+from pywisetransfer.retry import IDEMPOTENT_METHODS, RetryPolicy
+
+PROFILE_URL = "https://api.sandbox.transferwise.tech/v1/profiles/0"
+
+
+def test_retry_delay_rules():
+    policy = RetryPolicy(max_attempts=3, backoff_factor=1, jitter=False)
+
+    assert policy.retry_delay("GET", 1, status_code=503) == 1
+    assert policy.retry_delay("GET", 2, status_code=503) == 2
+    assert policy.retry_delay("GET", 3, status_code=503) is None
+    assert policy.retry_delay("GET", 1, status_code=400) is None
+    assert policy.retry_delay("GET", 1, status_code=503, retry_after=7) == 7
+    assert policy.retry_delay("POST", 1, status_code=503) is None
+    assert policy.retry_delay("POST", 1, sent=False) == 1
+    assert policy.retry_delay("GET", 1, deadline=time.monotonic() + 0.5) is None
+
+    idempotent = RetryPolicy(retry_methods=IDEMPOTENT_METHODS)
+    assert idempotent.retry_delay("PUT", 1, status_code=503) is not None
+
+
+def test_backoff_jitter_is_bounded():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+    assert all(0 <= policy.backoff(attempt) <= 4 for attempt in range(1, 10))
+
+
+@pytest.fixture
+def client():
+    return Client(api_key="test-key", retry=RetryPolicy(backoff_factor=0))
+
+
+@responses.activate
+def test_client_retries_server_errors(client):
+    responses.get(PROFILE_URL, status=503)
+    responses.get(PROFILE_URL, json={"id": 0, "type": "personal"})
+
+    assert client.profiles.get(profile_id=0).type == "personal"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_client_retries_connection_errors(client):
+    responses.get(PROFILE_URL, body=ConnectionError("reset"))
+    responses.get(PROFILE_URL, json={"id": 0, "type": "personal"})
+
+    assert client.profiles.get(profile_id=0).id == 0
+
+
+@responses.activate
+def test_client_gives_up_after_max_attempts(client):
+    responses.get(PROFILE_URL, status=502)
+
+    with pytest.raises(HTTPError):
+        client.profiles.get(profile_id=0)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_client_does_not_retry_unsafe_methods(client):
+    responses.post(PROFILE_URL, body=ConnectionError("reset"))
+
+    with pytest.raises(ConnectionError):
+        client.profiles.service.get(profile_id=0, method="POST")
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_client_retries_unsent_unsafe_methods(client):
+    responses.post(PROFILE_URL, body=ConnectTimeout("unreachable"))
+    responses.post(PROFILE_URL, json={"id": 0})
+
+    assert client.profiles.service.get(profile_id=0, method="POST")["id"] == 0
+
+
+@responses.activate
+def test_client_respects_deadline():
+    client = Client(api_key="test-key", retry=RetryPolicy(deadline=1))
+    responses.get(PROFILE_URL, status=503, headers={"Retry-After": "5"})
+
+    with pytest.raises(HTTPError):
+        client.profiles.get(profile_id=0)
+    assert len(responses.calls) == 1
+
+
+def test_async_client_retries_server_errors():
+    statuses = [502, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={"id": 0})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key",
+            transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(backoff_factor=0, deadline=5),
+        ) as client:
+            return await client.profiles.get(profile_id=0)
+
+    assert asyncio.run(main()).id == 0
+    assert statuses == []
+
+
+@responses.activate
+def test_deadline_bounds_rate_limited_retries():
+    client = Client(
+        api_key="test-key",
+        retry=RetryPolicy(deadline=1.0),
+        rate_limits={"default": RateLimit(10, 5)},
+    )
+    responses.get(PROFILE_URL, status=429, headers={"Retry-After": "2"})
+
+    start = time.monotonic()
+    with pytest.raises(HTTPError):
+        client.profiles.get(profile_id=0)
+    assert time.monotonic() - start < 1.0
+    assert len(responses.calls) == 1
+
+
+def test_async_deadline_bounds_rate_limited_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429, json={}, headers={"Retry-After": "2"})
+
+    async def main():
+        async with AsyncClient(
+            api_key="test-key",
+            transport=httpx.MockTransport(handler),
+            retry=RetryPolicy(deadline=1.0),
+            rate_limits={"default": RateLimit(10, 5)},
+        ) as client:
+            await client.profiles.get(profile_id=0)
+
+    start = time.monotonic()
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(main())
+    assert time.monotonic() - start < 1.0
+    assert len(calls) == 1
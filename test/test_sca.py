@@ -38,6 +38,10 @@ def statement_url():
     )
 
 
+def _without_signature(request):
+    return "X-Signature" not in request.headers, "request includes an SCA signature"
+
+
 @pytest.fixture
 def statement_forbidden(statement_url, sca_challenge, mocked_responses):
     url, _, qs = statement_url.partition("?")
@@ -46,6 +50,7 @@ def statement_forbidden(statement_url, sca_challenge, mocked_responses):
         url,
         match=[
             matchers.query_string_matcher(qs),
+            _without_signature,
         ],
         status=403,
         json={
@@ -187,6 +192,17 @@ def statement_authorised(
     )
 
 
+def _fetch_statement(client):
+    return client.balance_statements.statement(
+        profile_id=0,
+        balance_id=231,
+        currency="GBP",
+        interval_start="2018-03-01T00:00:00Z",
+        interval_end="2018-04-30T23:59:59.999Z",
+        type="FLAT",
+    )
+
+
 def test_sca_statement_without_private_key(statement_forbidden):
     client = Client(api_key="test-key")
     with pytest.raises(WiseClientConfigurationException, match="Please provide.*private_key.*"):
@@ -211,3 +227,36 @@ def test_sca_statement_with_private_key(statement_forbidden, statement_authorise
         type="FLAT",
     )
     assert "endOfStatementBalance" in statement
+
+
+def test_sca_approval_reused(statement_forbidden, statement_authorised, mocked_responses):
+    client = Client(api_key="test-key", private_key_file="test/test-sca.pem")
+    _fetch_statement(client)
+    _fetch_statement(client)
+
+    statuses = [call.response.status_code for call in mocked_responses.calls]
+    assert statuses == [403, 200, 200]
+
+
+def test_sca_approval_expiry(statement_forbidden, statement_authorised, mocked_responses):
+    client = Client(api_key="test-key", private_key_file="test/test-sca.pem", sca_approval_ttl=0)
+    _fetch_statement(client)
+    _fetch_statement(client)
+
+    statuses = [call.response.status_code for call in mocked_responses.calls]
+    assert statuses == [403, 200, 403, 200]
+
+
+def test_sca_statement_transactions_streamed(statement_forbidden, statement_authorised):
+    client = Client(api_key="test-key", private_key_file="test/test-sca.pem")
+    transactions = client.balance_statements.iter_transactions(
+        profile_id=0,
+        balance_id=231,
+        currency="GBP",
+        interval_start="2018-03-01T00:00:00Z",
+        interval_end="2018-04-30T23:59:59.999Z",
+        type="FLAT",
+        chunk_size=128,
+    )
+    references = [transaction.referenceNumber for transaction in transactions]
+    assert references == ["CARD-249281", "TRANSFER-34188888", "CONVERSION-1511237"]
@@ -0,0 +1,40 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pywisetransfer.sca import ScaApproval
+
+
+def test_concurrent_challenge_signed_once():
+    approval = ScaApproval()
+    signed = []
+    barrier = threading.Barrier(8)
+
+    def signer(challenge):
+        signed.append(challenge)
+        time.sleep(0.05)
+        return f"signature-of-{challenge}"
+
+    def reject_and_sign(_):
+        barrier.wait()
+        return approval.sign("challenge", signer)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(reject_and_sign, range(8)))
+
+    assert signed == ["challenge"]
+    assert all(result["X-Signature"] == "signature-of-challenge" for result in results)
+    assert approval.headers["X-2FA-Approval"] == "challenge"
+
+
+def test_new_challenge_signed_again():
+    approval = ScaApproval()
+    approval.sign("first", str.upper)
+    headers = approval.sign("second", str.upper)
+    assert headers == {"X-Signature": "SECOND", "X-2FA-Approval": "second"}
+
+
+def test_expired_approval_not_sent():
+    approval = ScaApproval(ttl=0)
+    approval.sign("challenge", str.upper)
+    assert approval.headers == {}
@@ -0,0 +1,64 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.session import WiseSession
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"[]"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_reuses_connections(local_server):
+    session = WiseSession()
+    for _ in range(3):
+        session.get(f"{local_server}/v1/profiles").raise_for_status()
+
+    stats = session.connection_stats()
+    assert stats.requests == 3
+    assert stats.connections == 1
+    assert stats.reused == 2
+
+
+def test_session_ignores_per_call_adapters():
+    session = WiseSession()
+    adapter = session.adapter
+    session.mount("https://", object())
+    assert session.get_adapter("https://api.transferwise.com") is adapter
+
+
+@responses.activate
+def test_client_calls_use_client_session():
+    responses.add(responses.GET, "https://api.sandbox.transferwise.tech/v1/profiles", json=[])
+
+    client = Client(api_key="test-key", timeout=(2, 5))
+    client.profiles.list()
+
+    assert (
+        client.session.get_adapter("https://api.sandbox.transferwise.tech")
+        is client.session.adapter
+    )
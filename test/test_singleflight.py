@@ -0,0 +1,66 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from pywisetransfer import Client
+from pywisetransfer.singleflight import SingleFlight
+
+
+def test_single_flight_shares_result():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+
+    def slow_call():
+        started.set()
+        release.wait()
+        return {"id": 1}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", slow_call)
+        started.wait()
+        followers = [executor.submit(flight.do, "key", slow_call) for _ in range(3)]
+        while flight.coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert all(result is results[0] for result in results)
+    assert (flight.executed, flight.coalesced) == (1, 3)
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    with pytest.raises(ValueError):
+        flight.do("key", lambda: int("invalid"))
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.executed == 2
+
+
+def test_client_coalesces_requests():
+    barrier = threading.Barrier(8)
+
+    def callback(request):
+        time.sleep(0.2)
+        return 200, {}, json.dumps({"id": 0, "type": "personal"})
+
+    client = Client(api_key="test-key", coalesce_requests=True)
+
+    def get_profile(_):
+        barrier.wait()
+        return client.profiles.get(profile_id=0)
+
+    with responses.RequestsMock() as mock:
+        mock.add_callback(
+            responses.GET, "https://api.sandbox.transferwise.tech/v1/profiles/0", callback=callback
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            profiles = list(executor.map(get_profile, range(8)))
+
+        assert len(mock.calls) == 1
+
+    assert all(profile.type == "personal" for profile in profiles)
+    assert client.single_flight.coalesced == 7
@@ -0,0 +1,52 @@
+import json
+
+import pytest
+
+from pywisetransfer.streaming import iter_json_array
+
+
+def _chunked(document, size):
+    data = document.encode("utf-8")
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+@pytest.fixture
+def statement_document():
+    return json.dumps(
+        {
+            "accountHolder": {"type": "PERSONAL", "note": 'contains "transactions": ['},
+            "transactions": [
+                {"type": "DEBIT", "amount": {"value": -7.76, "currency": "EUR"}},
+                {"type": "CREDIT", "amount": {"value": 200, "currency": "EUR"}, "name": "Zoë"},
+                {"type": "CREDIT", "amount": {"value": 12345, "currency": "EUR"}},
+            ],
+            "endOfStatementBalance": {"value": 9.94, "currency": "EUR"},
+        },
+        ensure_ascii=False,
+        indent=1,
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 4096])
+def test_iter_json_array(statement_document, chunk_size):
+    chunks = _chunked(statement_document, chunk_size)
+    items = list(iter_json_array(chunks, "transactions"))
+
+    assert items == json.loads(statement_document)["transactions"]
+
+
+def test_iter_json_array_stops_reading_after_array(statement_document):
+    chunks = iter(_chunked(statement_document, 16))
+    list(iter_json_array(chunks, "transactions"))
+
+    assert next(chunks, None) is not None
+
+
+@pytest.mark.parametrize("document", ['{"transactions": []}', '{"transactions": null}', "{}"])
+def test_iter_json_array_empty(document):
+    assert list(iter_json_array(_chunked(document, 3), "transactions")) == []
+
+
+def test_iter_json_array_truncated(statement_document):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(_chunked(statement_document[:200], 8), "transactions"))
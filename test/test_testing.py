@@ -0,0 +1,82 @@
+import asyncio
+import os
+
+import pytest
+import requests
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    PublicFormat,
+    load_pem_private_key,
+)
+
+from pywisetransfer.async_client import AsyncClient
+from pywisetransfer.ratelimit import RateLimit
+from pywisetransfer.retry import RetryPolicy
+from pywisetransfer.testing import MockWiseServer
+
+PRIVATE_KEY_FILE = os.path.join(os.path.dirname(__file__), "test-sca.pem")
+
+
+@pytest.fixture
+def server():
+    with MockWiseServer(statement_transactions=5000) as server:
+        yield server
+
+
+def test_profiles(server):
+    client = server.client()
+    assert [profile.id for profile in client.profiles.list()] == [1, 2]
+    assert client.profiles.get(profile_id=2).type == "business"
+
+
+def test_unknown_paths_and_missing_credentials(server):
+    assert requests.get(f"{server.url}/v1/unknown").status_code == 404
+    assert requests.get(f"{server.url}/v1/profiles").status_code == 401
+
+
+def test_sca_challenge_flow():
+    with open(PRIVATE_KEY_FILE, "rb") as f:
+        private_key = load_pem_private_key(f.read(), password=None)
+    public_key = private_key.public_key().public_bytes(
+        Encoding.PEM, PublicFormat.SubjectPublicKeyInfo
+    )
+
+    with MockWiseServer(sca_public_key=public_key, statement_transactions=3) as server:
+        client = server.client(private_key_file=PRIVATE_KEY_FILE)
+        statement = client.balance_statements.statement(
+            1, 2, "EUR", "2024-01-01T00:00:00Z", "2024-01-31T23:59:59.999Z"
+        )
+        assert len(statement.transactions) == 3
+
+        template = "/v1/profiles/{profile_id}/balance-statements/{balance_id}/statement.json"
+        assert server.stats[template, 403] == 1
+        assert server.stats[template, 200] == 1
+
+
+def test_large_statement_streaming(server):
+    client = server.client(private_key_file=PRIVATE_KEY_FILE)
+    transactions = client.balance_statements.iter_transactions(
+        1, 2, "EUR", "2024-01-01T00:00:00Z", "2024-01-31T23:59:59.999Z"
+    )
+    assert sum(1 for _ in transactions) == 5000
+
+
+def test_fault_injection_with_retries():
+    with MockWiseServer(rate_limit_rate=0.2, error_rate=0.2, seed=1) as server:
+        client = server.client(
+            rate_limits={"default": RateLimit(rate=1000, burst=10)},
+            retry=RetryPolicy(max_attempts=10, backoff_factor=0),
+        )
+        for _ in range(20):
+            assert len(client.balances.list(1)) == 3
+
+        statuses = {status for _, status in server.stats}
+        assert {200, 429} <= statuses and statuses & {500, 502, 503}
+
+
+def test_async_client(server):
+    async def main():
+        async with AsyncClient(api_key="mock-api-key", base_url=server.url) as client:
+            return await asyncio.gather(*(client.profiles.get(profile_id=n) for n in (1, 2)))
+
+    assert [profile.id for profile in asyncio.run(main())] == [1, 2]
@@ -1,11 +1,24 @@
+import asyncio
 import json
 from base64 import b64decode
+from io import BytesIO
 
 import pytest
 from requests import Request
 
-from pywisetransfer.exceptions import InvalidWebhookSignature
-from pywisetransfer.webhooks import validate_request, verify_signature
+from pywisetransfer.exceptions import InvalidWebhookRequest, InvalidWebhookSignature
+from pywisetransfer.keys import get_webhook_public_key
+from pywisetransfer.webhooks import (
+    WebhookVerifier,
+    validate_aiohttp_request,
+    validate_asgi_request,
+    validate_payload,
+    validate_request,
+    validate_starlette_request,
+    validate_wsgi_request,
+    verify_signature,
+    verify_signatures,
+)
 
 
 @pytest.fixture
@@ -43,6 +56,35 @@ def test_corrupt_signature(valid_payload, corrupt_signature):
     assert result is False
 
 
+def test_verifier_correct_signature(valid_payload, valid_signature):
+    verifier = WebhookVerifier()
+    assert verifier.verify(valid_payload, b64decode(valid_signature)) is True
+    assert verifier.verify(valid_payload, b64decode(valid_signature), "live") is False
+
+
+def test_verifier_key_rotation(valid_payload, valid_signature):
+    verifier = WebhookVerifier()
+    verifier.load_public_key("live", get_webhook_public_key("sandbox"))
+    assert verifier.verify(valid_payload, b64decode(valid_signature), "live") is True
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_verify_signatures_batch(
+    valid_payload, corrupt_payload, valid_signature, corrupt_signature, use_processes
+):
+    items = [
+        (valid_payload, b64decode(valid_signature)),
+        (corrupt_payload, b64decode(valid_signature)),
+        (valid_payload, None),
+        (valid_payload, b64decode(corrupt_signature)),
+        (valid_payload, b64decode(valid_signature)),
+    ]
+    results = verify_signatures(items, max_workers=2, use_processes=use_processes)
+
+    assert [result.valid for result in results] == [True, False, False, False, True]
+    assert [result.error is not None for result in results] == [False, False, True, False, False]
+
+
 def _construct_request(valid_payload, valid_signature):
     # Note: we construct an HTTP _client_ requests.Request object here, for
     # the purposes of building a test fixture.  The argument received at
@@ -75,3 +117,67 @@ def test_corrupt_request_signature(valid_payload, corrupt_signature):
     request = _construct_request(valid_payload, corrupt_signature)
     with pytest.raises(InvalidWebhookSignature):
         validate_request(request)
+
+
+def test_validate_payload(valid_payload, valid_signature):
+    headers = {"x-signature-sha256": valid_signature}
+    payload = validate_payload(memoryview(valid_payload), headers)
+    assert payload["event_type"] == "transfers#state-change"
+
+
+def test_validate_payload_corrupt(corrupt_payload, valid_signature):
+    with pytest.raises(InvalidWebhookSignature):
+        validate_payload(corrupt_payload, {"X-Signature-SHA256": valid_signature})
+
+
+def test_validate_payload_missing_signature(valid_payload):
+    with pytest.raises(InvalidWebhookRequest):
+        validate_payload(valid_payload, {})
+
+
+def test_validate_wsgi_request(valid_payload, valid_signature):
+    environ = {
+        "CONTENT_LENGTH": str(len(valid_payload)),
+        "HTTP_X_SIGNATURE_SHA256": valid_signature,
+        "wsgi.input": BytesIO(valid_payload),
+    }
+    payload = validate_wsgi_request(environ)
+    assert payload["schema_version"] == "2.0.0"
+
+
+def test_validate_asgi_request(valid_payload, valid_signature):
+    scope = {"type": "http", "headers": [(b"x-signature-sha256", valid_signature.encode())]}
+    messages = [
+        {"type": "http.request", "body": valid_payload[:50], "more_body": True},
+        {"type": "http.request", "body": valid_payload[50:]},
+    ]
+
+    async def receive():
+        return messages.pop(0)
+
+    payload = asyncio.run(validate_asgi_request(scope, receive))
+    assert payload["schema_version"] == "2.0.0"
+
+
+class _AsyncRequest:
+    def __init__(self, body, headers):
+        self._body = body
+        self.headers = headers
+
+    async def body(self):
+        return self._body
+
+    async def read(self):
+        return self._body
+
+
+def test_validate_starlette_request(valid_payload, corrupt_signature):
+    request = _AsyncRequest(valid_payload, {"X-Signature-SHA256": corrupt_signature})
+    with pytest.raises(InvalidWebhookSignature):
+        asyncio.run(validate_starlette_request(request))
+
+
+def test_validate_aiohttp_request(valid_payload, valid_signature):
+    request = _AsyncRequest(valid_payload, {"X-Signature-SHA256": valid_signature})
+    payload = asyncio.run(validate_aiohttp_request(request))
+    assert payload["subscription_id"] == "00000000-0000-0000-0000-000000000000"